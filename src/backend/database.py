@@ -103,29 +103,45 @@ class PromptManagerDB:
     
     # === Tasks ===
     def get_all_tasks(self) -> List[Dict[str, Any]]:
-        """모든 Task 조회"""
+        """모든 Task 조회 (버전/결과는 Task별로 따로 조회하지 않고 한 번에 로드)"""
         with self.get_connection() as conn:
-            cursor = conn.execute('''
+            task_rows = conn.execute('''
                 SELECT t.*, 
                        COUNT(v.id) as version_count
                 FROM tasks t
                 LEFT JOIN versions v ON t.id = v.task_id
                 GROUP BY t.id, t.name, t.is_favorite, t.variables, t.created_at, t.updated_at
                 ORDER BY t.updated_at DESC
-            ''')
-            
-            tasks = []
-            for row in cursor.fetchall():
-                task = dict(row)
-                # JSON 문자열을 파싱
-                task['variables'] = json.loads(task['variables']) if task['variables'] else {}
-                task['isFavorite'] = bool(task['is_favorite'])  # 프론트엔드 호환성
-                
-                # 버전들 조회
-                task['versions'] = self.get_task_versions(task['id'])
-                tasks.append(task)
-            
-            return tasks
+            ''').fetchall()
+            version_rows = conn.execute('''
+                SELECT * FROM versions
+                ORDER BY created_at DESC
+            ''').fetchall()
+            result_rows = conn.execute('''
+                SELECT * FROM results
+                ORDER BY timestamp DESC
+            ''').fetchall()
+        
+        results_by_version: Dict[str, List[Dict[str, Any]]] = {}
+        for row in result_rows:
+            results_by_version.setdefault(row['version_id'], []).append(self._row_to_result(row))
+        
+        versions_by_task: Dict[str, List[Dict[str, Any]]] = {}
+        for row in version_rows:
+            version = self._row_to_version(row)
+            version['results'] = results_by_version.get(version['id'], [])
+            versions_by_task.setdefault(version['task_id'], []).append(version)
+        
+        tasks = []
+        for row in task_rows:
+            task = dict(row)
+            # JSON 문자열을 파싱
+            task['variables'] = json.loads(task['variables']) if task['variables'] else {}
+            task['isFavorite'] = bool(task['is_favorite'])  # 프론트엔드 호환성
+            task['versions'] = versions_by_task.get(task['id'], [])
+            tasks.append(task)
+        
+        return tasks
     
     def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """특정 Task 조회"""
@@ -183,6 +199,25 @@ class PromptManagerDB:
             conn.commit()
             return cursor.rowcount > 0
     
+    def merge_task_variables(self, task_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Task 변수에 변경분 병합 (variables 컬럼만 읽고 씀, Task가 없으면 None)"""
+        with self.get_connection() as conn:
+            # 읽기 전에 쓰기 잠금을 잡아 동시 요청이 서로의 변경분을 덮어쓰지 않도록 함
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT variables FROM tasks WHERE id = ?', (task_id,)).fetchone()
+            if row is None:
+                return None
+            
+            variables = json.loads(row['variables']) if row['variables'] else {}
+            variables.update(changes)
+            conn.execute(
+                'UPDATE tasks SET variables = ?, updated_at = ? WHERE id = ?',
+                (json.dumps(variables, ensure_ascii=False), datetime.now().isoformat(), task_id)
+            )
+            conn.commit()
+        
+        return variables
+    
     def delete_task(self, task_id: str) -> bool:
         """Task 삭제 (CASCADE로 관련 데이터도 함께 삭제)"""
         with self.get_connection() as conn:
@@ -191,25 +226,38 @@ class PromptManagerDB:
             return cursor.rowcount > 0
     
     # === Versions ===
+    def _row_to_version(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """versions 행을 응답용 딕셔너리로 변환 (results 제외)"""
+        version = dict(row)
+        version['variables'] = json.loads(version['variables']) if version['variables'] else {}
+        return version
+    
     def get_task_versions(self, task_id: str) -> List[Dict[str, Any]]:
-        """특정 Task의 모든 Version 조회"""
+        """특정 Task의 모든 Version 조회 (결과는 버전별로 따로 조회하지 않고 한 번에 로드)"""
         with self.get_connection() as conn:
-            cursor = conn.execute('''
+            version_rows = conn.execute('''
                 SELECT * FROM versions 
                 WHERE task_id = ? 
                 ORDER BY created_at DESC
-            ''', (task_id,))
-            
-            versions = []
-            for row in cursor.fetchall():
-                version = dict(row)
-                version['variables'] = json.loads(version['variables']) if version['variables'] else {}
-                
-                # 결과들 조회
-                version['results'] = self.get_version_results(version['id'])
-                versions.append(version)
-            
-            return versions
+            ''', (task_id,)).fetchall()
+            result_rows = conn.execute('''
+                SELECT r.* FROM results r
+                JOIN versions v ON r.version_id = v.id
+                WHERE v.task_id = ?
+                ORDER BY r.timestamp DESC
+            ''', (task_id,)).fetchall()
+        
+        results_by_version: Dict[str, List[Dict[str, Any]]] = {}
+        for row in result_rows:
+            results_by_version.setdefault(row['version_id'], []).append(self._row_to_result(row))
+        
+        versions = []
+        for row in version_rows:
+            version = self._row_to_version(row)
+            version['results'] = results_by_version.get(version['id'], [])
+            versions.append(version)
+        
+        return versions
     
     def get_version_by_id(self, version_id: str) -> Optional[Dict[str, Any]]:
         """특정 Version 조회"""
@@ -220,8 +268,7 @@ class PromptManagerDB:
             if not row:
                 return None
             
-            version = dict(row)
-            version['variables'] = json.loads(version['variables']) if version['variables'] else {}
+            version = self._row_to_version(row)
             version['results'] = self.get_version_results(version_id)
             
             return version
@@ -272,6 +319,18 @@ class PromptManagerDB:
             return cursor.rowcount > 0
     
     # === Results ===
+    def _row_to_result(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """results 행을 응답용 딕셔너리로 변환"""
+        result = dict(row)
+        result['inputData'] = json.loads(result['input_data']) if result['input_data'] else {}
+        result['output'] = json.loads(result['output']) if result['output'] else {}
+        result['endpoint'] = json.loads(result['endpoint_info']) if result['endpoint_info'] else {}
+        
+        # 프론트엔드 호환성을 위해 기존 필드명도 유지
+        result.pop('input_data', None)
+        result.pop('endpoint_info', None)
+        return result
+    
     def get_version_results(self, version_id: str) -> List[Dict[str, Any]]:
         """특정 Version의 모든 Result 조회"""
         with self.get_connection() as conn:
@@ -281,19 +340,7 @@ class PromptManagerDB:
                 ORDER BY timestamp DESC
             ''', (version_id,))
             
-            results = []
-            for row in cursor.fetchall():
-                result = dict(row)
-                result['inputData'] = json.loads(result['input_data']) if result['input_data'] else {}
-                result['output'] = json.loads(result['output']) if result['output'] else {}
-                result['endpoint'] = json.loads(result['endpoint_info']) if result['endpoint_info'] else {}
-                
-                # 프론트엔드 호환성을 위해 기존 필드명도 유지
-                result.pop('input_data', None)
-                result.pop('endpoint_info', None)
-                results.append(result)
-            
-            return results
+            return [self._row_to_result(row) for row in cursor.fetchall()]
     
     def add_result(self, version_id: str, input_data: Dict[str, Any], 
                    output: Dict[str, Any], endpoint_info: Dict[str, Any] = None) -> str:
@@ -312,6 +359,30 @@ class PromptManagerDB:
         
         return result_id
     
+    def add_results(self, version_id: str, results: List[Dict[str, Any]]) -> int:
+        """여러 Result를 한 번에 추가 (연결/커밋 한 번으로 일괄 INSERT)"""
+        rows = [
+            (
+                str(uuid.uuid4()),
+                version_id,
+                json.dumps(result.get('inputData', {}), ensure_ascii=False),
+                json.dumps(result.get('output', {}), ensure_ascii=False),
+                json.dumps(result.get('endpoint') or {}, ensure_ascii=False)
+            )
+            for result in results
+        ]
+        if not rows:
+            return 0
+        
+        with self.get_connection() as conn:
+            conn.executemany('''
+                INSERT INTO results (id, version_id, input_data, output, endpoint_info)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+        
+        return len(rows)
+    
     def delete_result(self, version_id: str, timestamp: str) -> bool:
         """특정 Result 삭제 (timestamp 기준)"""
         with self.get_connection() as conn:
@@ -344,11 +415,9 @@ class PromptManagerDB:
             endpoints = []
             for row in cursor.fetchall():
                 raw_endpoint = dict(row)
-                print(f"🔧 [DB DEBUG] 원본 endpoint 데이터: {raw_endpoint}")
                 
                 # snake_case를 camelCase로 변환 (프론트엔드 호환성)
                 endpoint = self._convert_endpoint_to_frontend_format(raw_endpoint)
-                print(f"🔧 [DB DEBUG] 변환된 endpoint 데이터: {endpoint}")
                 endpoints.append(endpoint)
             
             print(f"✅ [DB DEBUG] 총 {len(endpoints)}개 endpoints 조회 완료")
@@ -369,7 +438,6 @@ class PromptManagerDB:
         """새 LLM Endpoint 생성"""
         endpoint_id = endpoint_data.get('id', str(uuid.uuid4()))
         print(f"🔧 [DB DEBUG] LLM Endpoint 생성 시작 - ID: {endpoint_id}")
-        print(f"🔧 [DB DEBUG] 입력 데이터: {endpoint_data}")
         
         try:
             with self.get_connection() as conn:
@@ -383,7 +451,6 @@ class PromptManagerDB:
                     endpoint_data.get('contextSize'),
                     endpoint_data.get('isDefault', False)
                 )
-                print(f"🔧 [DB DEBUG] SQL 실행 값: {values}")
                 
                 conn.execute('''
                     INSERT INTO llm_endpoints 
@@ -394,7 +461,7 @@ class PromptManagerDB:
                 print(f"✅ [DB DEBUG] SQL 실행 및 커밋 완료")
             
             result = self.get_llm_endpoint_by_id(endpoint_id)
-            print(f"✅ [DB DEBUG] 생성된 엔드포인트 조회 결과: {result}")
+            print(f"✅ [DB DEBUG] 생성된 엔드포인트 조회 완료 - ID: {endpoint_id}")
             return result
         except Exception as e:
             print(f"❌ [DB DEBUG] LLM Endpoint 생성 오류: {e}")
@@ -403,7 +470,6 @@ class PromptManagerDB:
     def update_llm_endpoint(self, endpoint_id: str, **updates) -> bool:
         """LLM Endpoint 업데이트"""
         print(f"🔧 [DB DEBUG] LLM Endpoint 업데이트 시작 - ID: {endpoint_id}")
-        print(f"🔧 [DB DEBUG] 업데이트 데이터: {updates}")
         
         if not updates:
             print(f"⚠️ [DB DEBUG] 업데이트할 데이터가 없음")
@@ -424,14 +490,12 @@ class PromptManagerDB:
                 updates[new_key] = updates.pop(old_key)
         
         updates['updated_at'] = datetime.now().isoformat()
-        print(f"🔧 [DB DEBUG] 필드명 변환 후: {updates}")
         
         # 동적 쿼리 생성
         set_clause = ', '.join([f"{key} = ?" for key in updates.keys()])
         query = f"UPDATE llm_endpoints SET {set_clause} WHERE id = ?"
         values = list(updates.values()) + [endpoint_id]
         print(f"🔧 [DB DEBUG] SQL 쿼리: {query}")
-        print(f"🔧 [DB DEBUG] SQL 값: {values}")
         
         try:
             with self.get_connection() as conn:
@@ -515,15 +579,9 @@ class PromptManagerDB:
                                     variables=version_data.get('variables', {})
                                 )
                                 
-                                # Results 마이그레이션
+                                # Results 마이그레이션 (결과마다 연결/커밋하지 않고 버전 단위로 일괄 추가)
                                 if 'results' in version_data:
-                                    for result_data in version_data['results']:
-                                        self.add_result(
-                                            version_id=version_id,
-                                            input_data=result_data.get('inputData', {}),
-                                            output=result_data.get('output', {}),
-                                            endpoint_info=result_data.get('endpoint', {})
-                                        )
+                                    self.add_results(version_id, version_data['results'])
             
             # LLM Endpoints 마이그레이션
             if 'llm_endpoints' in data:
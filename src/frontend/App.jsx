@@ -1,14 +1,22 @@
 // src/frontend/App.jsx
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, lazy, Suspense } from 'react';
 import { useStore } from './store.jsx';
 import ThreeColumnLayout from './components/layout/ThreeColumnLayout.jsx';
 import TaskNavigator from './components/task/TaskNavigator.jsx';
 import PromptEditor from './components/prompt/PromptEditor.jsx';
 import ResultViewer from './components/result/ResultViewer.jsx';
-import LLMEndpointSettings from './components/settings/LLMEndpointSettings.jsx';
 import { apiUrl } from './utils/api.js';
 import './App.css';
 
+// LLM Provider 설정 화면은 열 때 처음 불러옴 (목록/폼 컴포넌트까지 초기 번들에서 제외)
+const LLMEndpointSettings = lazy(() => import('./components/settings/LLMEndpointSettings.jsx'));
+
+// 현재 주소와 같으면 history 항목을 새로 쌓지 않음 (같은 Task를 다시 선택해도 뒤로가기 기록이 늘지 않도록)
+const pushViewState = (state, url) => {
+  if (`${window.location.pathname}${window.location.search}` === url) return;
+  window.history.pushState(state, '', url);
+};
+
 function App() {
   const {
     tasks, 
@@ -53,11 +61,11 @@ function App() {
       setCurrentTask(taskId);
       setCurrentView('task-detail');
       const newUrl = `${window.location.pathname}?task=${taskId}`;
-      window.history.pushState({ taskId, view: 'task-detail' }, '', newUrl);
+      pushViewState({ taskId, view: 'task-detail' }, newUrl);
     } else {
       setCurrentTask(null);
       setCurrentView('task-list');
-      window.history.pushState({ view: 'task-list' }, '', window.location.pathname);
+      pushViewState({ view: 'task-list' }, window.location.pathname);
     }
   };
   
@@ -65,17 +73,17 @@ function App() {
     setCurrentTask(null);
     setCurrentView('settings');
     const newUrl = `${window.location.pathname}?settings=llm-endpoints`;
-    window.history.pushState({ view: 'settings' }, '', newUrl);
+    pushViewState({ view: 'settings' }, newUrl);
   };
 
   const handleEditorClick = () => {
     if (currentTask) {
       setCurrentView('task-detail');
       const newUrl = `${window.location.pathname}?task=${currentTask}`;
-      window.history.pushState({ taskId: currentTask, view: 'task-detail' }, '', newUrl);
+      pushViewState({ taskId: currentTask, view: 'task-detail' }, newUrl);
     } else {
       setCurrentView('task-list');
-      window.history.pushState({ view: 'task-list' }, '', window.location.pathname);
+      pushViewState({ view: 'task-list' }, window.location.pathname);
     }
   };
   
@@ -156,7 +164,9 @@ function App() {
       {/* Main Content */}
       <div className="main-content">
         {currentView === 'settings' ? (
-          <LLMEndpointSettings />
+          <Suspense fallback={null}>
+            <LLMEndpointSettings />
+          </Suspense>
         ) : (
           <ThreeColumnLayout
             leftPanel={
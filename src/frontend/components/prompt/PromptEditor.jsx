@@ -1,70 +1,232 @@
 // src/frontend/components/prompt/PromptEditor.jsx
-import React, { useState, useEffect, useRef, useCallback } from 'react';
+import React, { useState, useEffect, useLayoutEffect, useRef, useCallback, useMemo, useDeferredValue } from 'react';
 import { useStore } from '../../store.jsx';
 
+// 변수 값 입력을 묶어서 저장하기 위한 지연 시간 (ms)
+const VARIABLE_SAVE_DELAY_MS = 300;
+
+// 입력이 멈춘 뒤 변수 추출을 한 번만 실행하기 위한 지연 시간 (ms)
+const VARIABLE_EXTRACT_DELAY_MS = 150;
+
+// 변수 토큰 ({{...}}) - 미리보기 치환용, 한 번만 컴파일해서 재사용
+const VARIABLE_TOKEN_PATTERN = /\{\{[^}]+\}\}/g;
+
+// VARIABLE_TOKEN_PATTERN과 같은 토큰을 indexOf만으로 찾아 [시작, 끝) 위치를 onToken으로 전달
+// (하이라이트는 입력마다 실행되므로 match 객체를 만들지 않음)
+const scanVariableTokens = (text, onToken) => {
+  let start = text.indexOf('{{');
+  while (start !== -1) {
+    const close = text.indexOf('}', start + 2);
+    if (close === -1) return;
+    if (close > start + 2 && text.charCodeAt(close + 1) === 125) { // }}
+      onToken(start, close + 2);
+      start = text.indexOf('{{', close + 2);
+    } else {
+      start = text.indexOf('{{', close + 1);
+    }
+  }
+};
+
+// 변수 이름 문자 판별 (정규식 대신 문자 코드로 검사)
+const isNameStart = (code) => (
+  (code >= 65 && code <= 90) || (code >= 97 && code <= 122) || code === 95 // A-Z a-z _
+);
+const isNameChar = (code) => (
+  isNameStart(code) || (code >= 48 && code <= 57) || code === 45 // 0-9 -
+);
+
+// {{name}} 형태의 변수 이름을 indexOf + 문자 코드 비교로 한 번에 훑어 names에 추가
+// 이름은 영문자/언더스코어로 시작하고 영문자, 숫자, _, - 만 허용 (큰 프롬프트에서도 정규식 엔진을 거치지 않음)
+const collectVariableNames = (text, names) => {
+  let start = text.indexOf('{{');
+  while (start !== -1) {
+    const nameStart = start + 2;
+    let end = nameStart;
+    if (end < text.length && isNameStart(text.charCodeAt(end))) {
+      end += 1;
+      while (end < text.length && isNameChar(text.charCodeAt(end))) end += 1;
+      if (text.charCodeAt(end) === 125 && text.charCodeAt(end + 1) === 125) { // }}
+        names.add(text.slice(nameStart, end));
+        start = text.indexOf('{{', end + 2);
+        continue;
+      }
+    }
+    start = text.indexOf('{{', start + 1);
+  }
+  return names;
+};
+
+// 스타일 객체들을 상수로 분리 (렌더링마다 새로 만들지 않도록)
+const styles = {
+  highlightOverlay: {
+    position: 'absolute',
+    top: 0,
+    left: 0,
+    right: 0,
+    bottom: 0,
+    overflow: 'hidden',
+    pointerEvents: 'none',
+    zIndex: 1,
+    padding: 0,
+    margin: 0,
+    border: 'none',
+    fontFamily: 'inherit',
+    fontSize: 'inherit',
+    lineHeight: 'inherit',
+    boxSizing: 'border-box'
+  },
+  overlayContent: {
+    whiteSpace: 'pre-wrap',
+    wordWrap: 'break-word',
+    overflowWrap: 'break-word',
+    minHeight: '100%',
+    fontFamily: 'inherit',
+    fontSize: 'inherit',
+    lineHeight: 'inherit',
+    padding: '12px',
+    margin: 0,
+    border: 'none',
+    color: 'transparent',
+    boxSizing: 'border-box'
+  },
+  highlightInput: {
+    position: 'absolute',
+    top: 0,
+    left: 0,
+    right: 0,
+    bottom: 0,
+    width: '100%',
+    height: '100%',
+    background: 'transparent',
+    color: 'var(--text-primary)',
+    border: 'none',
+    resize: 'none',
+    outline: 'none',
+    fontFamily: 'inherit',
+    fontSize: '13px',
+    lineHeight: '1.5',
+    padding: '12px',
+    margin: 0,
+    boxSizing: 'border-box',
+    zIndex: 2
+  },
+  mainPromptEditor: {
+    color: 'var(--text-primary)',
+    fontFamily: 'inherit',
+    lineHeight: '1.5',
+    minHeight: '200px'
+  },
+  activeBadge: {
+    background: 'rgba(16, 185, 129, 0.2)',
+    color: 'var(--accent-success)'
+  },
+  saveStatus: {
+    saving: { background: 'rgba(234, 179, 8, 0.2)', color: '#eab308' },
+    error: { background: 'rgba(239, 68, 68, 0.2)', color: '#ef4444' },
+    saved: { background: 'rgba(107, 114, 128, 0.1)', color: 'var(--text-muted)' }
+  },
+  previewSystemBox: {
+    background: 'rgba(16, 185, 129, 0.1)',
+    borderColor: 'var(--accent-success)'
+  },
+  previewPromptBox: {
+    background: 'var(--bg-tertiary)',
+    borderColor: 'var(--border-primary)'
+  },
+  previewSystemLabel: { color: 'var(--accent-success)' },
+  previewText: { color: 'var(--text-secondary)' },
+  mutedText: { color: 'var(--text-muted)' },
+  primaryText: { color: 'var(--text-primary)' },
+  scrollBody: { height: 0 },
+  newVariableInput: { resize: 'vertical', minHeight: '60px' },
+  addVariableButton: { alignSelf: 'flex-start', minWidth: '60px' },
+  footer: { borderColor: 'var(--border-primary)' }
+};
+
+// 변수 토큰만 하이라이트하고 나머지 텍스트는 레이아웃 유지를 위해 투명하게 렌더링
+// 오버레이(overlayContent)가 이미 투명 글자색이므로 토큰 사이 텍스트는 span 없이 텍스트 노드로 둠
+// (변수가 많은 줄도 하이라이트 span 수만큼만 엘리먼트를 만듦)
+// ranges: 줄 안의 하이라이트 구간 "시작:끝" 목록 (splitHighlightedLines 참고)
+const renderHighlightedContent = (text, ranges) => {
+  if (!text) return null;
+  // 하이라이트 구간이 없는 줄은 통째로 렌더링
+  if (!ranges) return text;
+  
+  const renderedElements = [];
+  let lastIndex = 0;
+  ranges.split(',').forEach((range) => {
+    const separator = range.indexOf(':');
+    const start = Number(range.slice(0, separator));
+    const end = Number(range.slice(separator + 1));
+    if (start > lastIndex) renderedElements.push(text.slice(lastIndex, start));
+    renderedElements.push(
+      <span key={start} className="variable-highlight">
+        {text.slice(start, end)}
+      </span>
+    );
+    lastIndex = end;
+  });
+  if (lastIndex < text.length) renderedElements.push(text.slice(lastIndex));
+  
+  return renderedElements;
+};
+
+// 줄 단위 하이라이트 - 내용이나 하이라이트 구간이 바뀐 줄만 다시 렌더링
+const HighlightLine = React.memo(({ text, ranges }) => renderHighlightedContent(text, ranges));
+
+// 변수 객체의 키/값이 모두 같은지 비교 (store 동기화로 같은 내용의 새 객체가 들어온 경우 판별)
+const sameVariables = (a, b) => {
+  if (a === b) return true;
+  const keys = Object.keys(a);
+  if (keys.length !== Object.keys(b).length) return false;
+  return keys.every(key => key in b && a[key] === b[key]);
+};
+
+// 토큰은 전체 텍스트에서 한 번에 찾은 뒤 줄 단위로 나눔 (줄바꿈을 포함한 {{ ... }} 토큰도 하이라이트되도록)
+// 줄바꿈은 각 줄 끝에 남김 (overlay 레이아웃이 textarea와 같도록)
+// 각 줄은 { text, ranges } - ranges는 줄 안의 하이라이트 구간 "시작:끝" 목록 문자열 (memo 비교가 값으로 되도록)
+const splitHighlightedLines = (text) => {
+  if (!text) return [];
+  const tokens = [];
+  scanVariableTokens(text, (start, end) => tokens.push(start, end));
+
+  const lines = [];
+  let tokenIndex = 0;
+  let lineStart = 0;
+  for (;;) {
+    const newline = text.indexOf('\n', lineStart);
+    const lineEnd = newline === -1 ? text.length : newline + 1;
+    // 이 줄보다 앞에서 끝난 토큰은 건너뜀
+    while (tokenIndex < tokens.length && tokens[tokenIndex + 1] <= lineStart) tokenIndex += 2;
+    const ranges = [];
+    for (let i = tokenIndex; i < tokens.length && tokens[i] < lineEnd; i += 2) {
+      ranges.push(`${Math.max(tokens[i], lineStart) - lineStart}:${Math.min(tokens[i + 1], lineEnd) - lineStart}`);
+    }
+    lines.push({ text: text.slice(lineStart, lineEnd), ranges: ranges.join(',') });
+    if (newline === -1) break;
+    lineStart = lineEnd;
+  }
+  return lines;
+};
+
  // Highlight Editor Component (overlay highlighter to avoid cursor jump)
 const HighlightEditor = ({ value, onChange, onBlur, placeholder, className, style }) => {
   const containerRef = useRef(null);
   const textareaRef = useRef(null);
   const overlayContentRef = useRef(null);
+  const lastInputValueRef = useRef(null); // 사용자가 직접 입력한 마지막 값
 
-  const escapeHtml = (text) => {
-    if (text == null) return '';
-    return String(text)
-      .replace(/&/g, '&')
-      .replace(/</g, '<')
-      .replace(/>/g, '>')
-      .replace(/"/g, '"')
-      .replace(/'/g, '&#39;');
-  };
+  // 하이라이트는 입력보다 낮은 우선순위로 갱신 - 빠르게 타이핑하면 중간 값은 건너뜀
+  const deferredValue = useDeferredValue(value);
+  // 문서 전체에 '{{'가 없으면 줄을 나누지 않고 텍스트 하나로 렌더링
+  // (변수 없는 긴 프롬프트에서 키 입력마다 줄 수만큼의 memo 컴포넌트를 비교하지 않음)
+  const highlightedLines = useMemo(
+    () => (deferredValue && deferredValue.includes('{{') ? splitHighlightedLines(deferredValue) : null),
+    [deferredValue]
+  );
 
-  const renderHighlightedContent = (text) => {
-    if (!text) return null;
-    
-    // Split text by variables and render each part
-    const parts = text.split(/(\{\{[^}]+\}\})/g);
-    
-    const renderedElements = parts.map((part, index) => {
-      if (part.match(/\{\{[^}]+\}\}/)) {
-        // This is a variable
-        const variable = part.slice(2, -2).trim();
-        const element = (
-          <span 
-            key={index} 
-            className="variable-highlight"
-          >
-            {`{{${variable}}}`}
-          </span>
-        );
-        return element;
-      } else if (part.length > 0) {
-        // Render ALL text parts (including whitespace) as transparent to maintain layout
-        const element = (
-          <span 
-            key={index} 
-            style={{ 
-              color: 'transparent'
-            }}
-          >
-            {part}
-          </span>
-        );
-        return element;
-      } else {
-        // 빈 문자열도 빈 span으로 렌더링해서 위치를 유지
-        const element = (
-          <span 
-            key={index}
-          >
-            {part}
-          </span>
-        );
-        return element;
-      }
-    });
-    
-    return renderedElements;
-  };
+  // container keeps visual styles via existing CSS + incoming style (style이 바뀔 때만 새로 병합)
+  const containerStyle = useMemo(() => ({ position: 'relative', ...style }), [style]);
 
   const handleScrollSync = (e) => {
     const t = e.currentTarget;
@@ -73,17 +235,18 @@ const HighlightEditor = ({ value, onChange, onBlur, placeholder, className, styl
     }
   };
 
-  // Keep overlay transform in sync if value changes and textarea has scrolled
-  useEffect(() => {
+  const handleInput = (e) => {
+    lastInputValueRef.current = e.target.value;
+    if (onChange) onChange(e.target.value);
+  };
+
+  // 버전 전환 등으로 값이 통째로 바뀐 경우에만 overlay 위치를 한 번 동기화
+  // (타이핑 중에는 scroll 이벤트로 충분하므로 매 키 입력마다 레이아웃을 강제로 읽지 않음)
+  useLayoutEffect(() => {
+    if (value === lastInputValueRef.current) return;
     if (overlayContentRef.current && textareaRef.current) {
       const t = textareaRef.current;
-      const overlay = overlayContentRef.current;
-      const overlayContainer = overlay.parentElement;
-      const mainContainer = containerRef.current;
-      
-      overlay.style.transform = `translate(${-t.scrollLeft}px, ${-t.scrollTop}px)`;
-      
-      // Position overlay to match textarea
+      overlayContentRef.current.style.transform = `translate(${-t.scrollLeft}px, ${-t.scrollTop}px)`;
     }
   }, [value]);
 
@@ -91,53 +254,24 @@ const HighlightEditor = ({ value, onChange, onBlur, placeholder, className, styl
     <div
       ref={containerRef}
       className={`highlight-editor ${className || ''}`}
-      style={{
-        position: 'relative',
-        // container keeps visual styles via existing CSS + incoming style
-        ...style
-      }}
+      style={containerStyle}
     >
       {/* Highlight overlay - only shows variable highlighting */}
       <div
         aria-hidden="true"
         className="highlight-overlay"
-        style={{
-          position: 'absolute',
-          top: 0,
-          left: 0,
-          right: 0,
-          bottom: 0,
-          overflow: 'hidden',
-          pointerEvents: 'none',
-          zIndex: 1,
-          padding: 0,
-          margin: 0,
-          border: 'none',
-          fontFamily: 'inherit',
-          fontSize: 'inherit',
-          lineHeight: 'inherit',
-          boxSizing: 'border-box'
-        }}
+        style={styles.highlightOverlay}
       >
         <div
           ref={overlayContentRef}
           className="overlay-content"
-          style={{
-            whiteSpace: 'pre-wrap',
-            wordWrap: 'break-word',
-            overflowWrap: 'break-word',
-            minHeight: '100%',
-            fontFamily: 'inherit',
-            fontSize: 'inherit',
-            lineHeight: 'inherit',
-            padding: '12px',
-            margin: 0,
-            border: 'none',
-            color: 'transparent',
-            boxSizing: 'border-box'
-          }}
+          style={styles.overlayContent}
         >
-          {renderHighlightedContent(value)}
+          {highlightedLines
+            ? highlightedLines.map((line, index) => (
+              <HighlightLine key={index} text={line.text} ranges={line.ranges} />
+            ))
+            : deferredValue}
         </div>
       </div>
 
@@ -145,7 +279,7 @@ const HighlightEditor = ({ value, onChange, onBlur, placeholder, className, styl
       <textarea
         ref={textareaRef}
         value={value}
-        onChange={(e) => onChange && onChange(e.target.value)}
+        onChange={handleInput}
         onBlur={onBlur}
         onScroll={handleScrollSync}
         placeholder={placeholder}
@@ -153,40 +287,113 @@ const HighlightEditor = ({ value, onChange, onBlur, placeholder, className, styl
         autoCorrect="off"
         autoCapitalize="off"
         className="highlight-input"
-        style={{
-          position: 'absolute',
-          top: 0,
-          left: 0,
-          right: 0,
-          bottom: 0,
-          width: '100%',
-          height: '100%',
-          background: 'transparent',
-          color: 'var(--text-primary)',
-          border: 'none',
-          resize: 'none',
-          outline: 'none',
-          fontFamily: 'inherit',
-          fontSize: '13px',
-          lineHeight: '1.5',
-          padding: '12px',
-          margin: 0,
-          boxSizing: 'border-box',
-          zIndex: 2
-        }}
+        style={styles.highlightInput}
       />
     </div>
   );
 };
 
+// 타임라인 항목 - 현재 버전이 바뀌면 이전/새 활성 항목 두 개만 다시 렌더링
+const TimelineItem = React.memo(({ versionId, label, isActive }) => (
+  <div className="timeline-item" data-version-id={versionId}>
+    <div className={`timeline-dot ${isActive ? 'active' : ''}`} />
+    <div className={`timeline-label ${isActive ? 'active' : ''}`}>
+      {label}
+    </div>
+  </div>
+));
+
+// Version Timeline Component
+// 편집 중 키 입력으로 인한 재렌더링을 피하기 위해 memo 처리하고,
+// 버전마다 클릭 핸들러를 만들지 않고 컨테이너에서 한 번에 처리
+const VersionTimeline = React.memo(({ versions, currentVersionId, onSelect }) => {
+  const handleClick = useCallback((e) => {
+    const item = e.target.closest('[data-version-id]');
+    if (item) {
+      onSelect(item.dataset.versionId);
+    }
+  }, [onSelect]);
+
+  return (
+    <div className="version-timeline" onClick={handleClick}>
+      <div className="timeline-line"></div>
+      {versions.map((version, index) => (
+        <TimelineItem
+          key={version.id}
+          versionId={version.id}
+          label={version.name || `v${index + 1}`}
+          isActive={currentVersionId === version.id}
+        />
+      ))}
+    </div>
+  );
+});
+
+// Variable Card Component
+// 입력 중인 값은 카드 로컬 상태로 관리해서 키 입력마다 전체 변수 객체를 복사하지 않음
+// memo 처리해서 다른 변수의 값/목록이 바뀌어도 props가 같은 카드는 다시 렌더링하지 않음
+const VariableCard = React.memo(({ name, value, isUsed, onValueChange, onCommit, onRemove }) => {
+  const [draft, setDraft] = useState(value);
+
+  // 외부(store 동기화, 변수 추가/삭제)에서 값이 바뀐 경우 반영
+  useEffect(() => {
+    setDraft(value);
+  }, [value]);
+
+  // 키 입력 처리는 핸들러 하나에서 로컬 값 갱신과 debounce 저장 예약을 함께 수행
+  // (draft가 바뀌어 카드가 다시 렌더링될 때마다 핸들러를 새로 만들지 않음)
+  const handleChange = useCallback((e) => {
+    const nextValue = e.target.value;
+    setDraft(nextValue);
+    onValueChange(name, nextValue);
+  }, [name, onValueChange]);
+  const handleRemove = useCallback(() => onRemove(name), [name, onRemove]);
+
+  return (
+    <div className="card variable-card">
+      <div className="flex items-start gap-3">
+        <div className="flex-shrink-0 pt-2">
+          <span className="variable-badge">{`{{${name}}}`}</span>
+        </div>
+        <div className="flex-1">
+          <label className="block text-xs mb-1" style={styles.mutedText}>
+            {name}
+          </label>
+          <textarea
+            value={draft}
+            onChange={handleChange}
+            onBlur={onCommit}
+            spellCheck={false}
+            autoCorrect="off"
+            autoCapitalize="off"
+            className="variable-value-input w-full p-2 border rounded text-sm"
+            placeholder={`Enter value for ${name}... (supports multiline text)`}
+            rows="3"
+          />
+        </div>
+        <button
+          className="variable-delete-btn flex-shrink-0 text-xs px-2 py-1 rounded transition-colors"
+          onClick={handleRemove}
+          disabled={isUsed}
+          title={isUsed ? "Variable is used in a prompt and cannot be deleted." : "Delete variable"}
+        >
+          Delete
+        </button>
+      </div>
+    </div>
+  );
+});
+
 const PromptEditor = ({ taskId, versionId }) => {
   const {
     tasks,
+    versionsById,
     createVersion,
     setCurrentVersion,
     currentVersion,
     updateVersion,
-    updateVariables
+    updateVariables,
+    updateVariableValues
   } = useStore();
   
   const [promptText, setPromptText] = useState('');
@@ -194,7 +401,10 @@ const PromptEditor = ({ taskId, versionId }) => {
   const [taskName, setTaskName] = useState('');
   const [taskDescription, setTaskDescription] = useState('');
   const [taskVariables, setTaskVariables] = useState({});  // Task 레벨 variables
+  const taskVariablesRef = useRef(taskVariables); // 변수 카드 핸들러가 최신 값을 읽기 위한 참조 (핸들러를 다시 만들지 않음)
+  taskVariablesRef.current = taskVariables;
   const [activeTab, setActiveTab] = useState('prompt'); // 'prompt' or 'variables'
+  const [variablesMounted, setVariablesMounted] = useState(false); // 변수 탭은 처음 열 때 마운트
   const [isPreviewMode, setIsPreviewMode] = useState(false);
   const [newVariable, setNewVariable] = useState({ name: '', value: '' });
   const [isEditingName, setIsEditingName] = useState(false);
@@ -202,40 +412,67 @@ const PromptEditor = ({ taskId, versionId }) => {
   // 자동 저장 관련 상태
   const [saveStatus, setSaveStatus] = useState('saved'); // 'saving', 'saved', 'error'
   const autoSaveTimeoutRef = useRef(null);
+  const saveStatusTimeoutRef = useRef(null); // 에러 표시 후 상태 초기화 타이머
   const lastSavedContentRef = useRef({ promptText: '', systemPrompt: '', taskDescription: '' });
+  // 변수 값 저장 debounce 관련
+  const variableSaveTimeoutRef = useRef(null);
+  const pendingVariablesRef = useRef(null); // { taskId, base, edits } - 아직 저장되지 않은 변수 편집
+  const loadedVersionKeyRef = useRef(null); // 편집기에 로드된 "taskId:versionId"
+  const currentTaskIdRef = useRef(taskId);
+  currentTaskIdRef.current = taskId;
 
   const currentTask = taskId ? tasks[taskId] : null;
 
+  // 저장 상태 변경 - 이전에 예약된 초기화 타이머를 항상 정리해서
+  // 오래된 타이머가 새 상태를 덮어쓰지 않도록 함
+  const updateSaveStatus = useCallback((status, resetAfterMs = null) => {
+    if (saveStatusTimeoutRef.current) {
+      clearTimeout(saveStatusTimeoutRef.current);
+      saveStatusTimeoutRef.current = null;
+    }
+    setSaveStatus(status);
+    if (resetAfterMs !== null) {
+      saveStatusTimeoutRef.current = setTimeout(() => {
+        saveStatusTimeoutRef.current = null;
+        setSaveStatus('saved');
+      }, resetAfterMs);
+    }
+  }, []);
+
   // Task variables를 store의 currentTask에서 직접 가져오기
   useEffect(() => {
-    console.log(`🔧 [DEBUG] PromptEditor: Task 변수 로드 useEffect 실행`, { 
-      currentTask: !!currentTask, 
-      taskId, 
-      hasVariables: !!(currentTask?.variables) 
-    });
-    
+    // 저장 대기 중인 로컬 편집이 있으면 덮어쓰지 않음
+    if (pendingVariablesRef.current && pendingVariablesRef.current.taskId === taskId) {
+      return;
+    }
+
     if (currentTask) {
+      // Task 목록/버전 재로드로 같은 내용의 새 객체가 들어오면 기존 상태를 유지해
+      // 변수 카드와 입력 핸들러가 다시 만들어지지 않도록 함
       const variables = currentTask.variables || {};
-      console.log(`🔧 [DEBUG] PromptEditor: store에서 Task 변수 로드 완료`, { 
-        taskId, 
-        variables,
-        variableCount: Object.keys(variables).length 
-      });
-      setTaskVariables(variables);
+      setTaskVariables(prev => (sameVariables(prev, variables) ? prev : variables));
     } else {
-      console.log(`🔧 [DEBUG] PromptEditor: currentTask가 없어서 변수 초기화`);
       setTaskVariables({});
     }
   }, [currentTask, taskId]);
 
   useEffect(() => {
-    const currentVersionData = currentTask?.versions?.find(v => v.id === versionId);
+    setTaskName(currentTask?.name || '');
+  }, [currentTask?.name]);
 
-    if (currentTask) {
-      setTaskName(currentTask.name || '');
+  // 버전이 바뀐 경우에만 편집기 내용을 교체
+  // (저장 후 store 갱신으로 currentTask가 바뀌어도 편집 중인 내용을 다시 로드하지 않음)
+  useEffect(() => {
+    const currentVersionData = versionsById.get(versionId);
+    const versionKey = `${taskId}:${versionId}`;
+
+    if (currentVersionData && loadedVersionKeyRef.current === versionKey) {
+      return;
     }
     
     if (currentVersionData) {
+      loadedVersionKeyRef.current = versionKey;
+
       // 기존 버전 데이터 로드
       const content = currentVersionData.content || '';
       const system_prompt = currentVersionData.system_prompt || 'You are a helpfull AI Assistant';
@@ -251,8 +488,9 @@ const PromptEditor = ({ taskId, versionId }) => {
         systemPrompt: system_prompt,
         taskDescription: description
       };
-      setSaveStatus('saved');
+      updateSaveStatus('saved');
     } else {
+      loadedVersionKeyRef.current = null;
       // Clear fields if no version is selected or found
       const defaultSystemPrompt = 'You are a helpfull AI Assistant';
       
@@ -267,10 +505,25 @@ const PromptEditor = ({ taskId, versionId }) => {
         taskDescription: ''
       };
     }
-  }, [versionId, currentTask]); // Depend directly on versionId and currentTask
+  }, [taskId, versionId, versionsById]);
 
+  // 변수 추출용 입력은 타이핑이 잠시 멈췄을 때만 갱신 (연속 입력은 한 번의 추출로 묶음)
+  const [extractionInput, setExtractionInput] = useState({ promptText: '', systemPrompt: '' });
+  useEffect(() => {
+    const timeoutId = setTimeout(() => {
+      setExtractionInput(prev => (
+        prev.promptText === promptText && prev.systemPrompt === systemPrompt
+          ? prev
+          : { promptText, systemPrompt }
+      ));
+    }, VARIABLE_EXTRACT_DELAY_MS);
+    return () => clearTimeout(timeoutId);
+  }, [promptText, systemPrompt]);
+
+  const extractedVariablesRef = useRef([]); // 직전 추출 결과 (변수 이름 집합이 같으면 그대로 재사용)
   const extractedVariables = React.useMemo(() => {
     if (!currentTask) return [];
+    const { promptText, systemPrompt } = extractionInput;
     
     const allPromptsContent = new Set();
     
@@ -286,63 +539,61 @@ const PromptEditor = ({ taskId, versionId }) => {
     if (promptText) allPromptsContent.add(promptText);
     if (systemPrompt) allPromptsContent.add(systemPrompt);
     
-    const allMatches = [];
-    allPromptsContent.forEach((p) => {
-      // 더 정확한 변수 추출을 위해 영문자, 숫자, 언더스코어, 하이픈만 허용
-      const matches = p.match(/\{\{([a-zA-Z_][a-zA-Z0-9_-]*)\}\}/g) || [];
-      allMatches.push(...matches);
-    });
+    // 캡처한 이름을 바로 Set에 추가 ('{{'가 없는 본문은 indexOf 한 번으로 끝남)
+    const names = new Set();
+    allPromptsContent.forEach((p) => collectVariableNames(p, names));
     
-    const extractedVars = [...new Set(allMatches.map(match => match.slice(2, -2)))];
-    return extractedVars;
-  }, [currentTask, promptText, systemPrompt]);
+    // 이름 집합이 바뀌지 않았으면 이전 배열을 그대로 돌려줘서 변수 목록이 다시 계산/렌더링되지 않도록 함
+    const previous = extractedVariablesRef.current;
+    if (previous.length === names.size && previous.every(name => names.has(name))) {
+      return previous;
+    }
+    const next = [...names];
+    extractedVariablesRef.current = next;
+    return next;
+  }, [currentTask, extractionInput]);
+
+  // 카드마다 배열을 훑지 않도록 사용 중인 변수 이름을 Set으로 유지
+  const usedVariables = React.useMemo(() => new Set(extractedVariables), [extractedVariables]);
 
   const displayedVariables = React.useMemo(() => {
-    const fromPrompts = extractedVariables;
-    const fromState = Object.keys(taskVariables);
-    return [...new Set([...fromPrompts, ...fromState])];
+    // 프롬프트에 없는 저장된 변수만 뒤에 덧붙임 (없으면 추출 결과 배열을 그대로 사용)
+    const extracted = new Set(extractedVariables);
+    const missing = Object.keys(taskVariables).filter(name => !extracted.has(name));
+    return missing.length === 0 ? extractedVariables : extractedVariables.concat(missing);
   }, [extractedVariables, taskVariables]);
 
   // 실제 자동 저장 실행
   const handleAutoSave = useCallback(async () => {
     if (!taskId || !versionId) return;
     
-    // 변경사항이 있는지 확인
-    const currentContent = {
-      promptText,
-      systemPrompt,
-      taskDescription
-    };
-    
+    // 마지막 저장 이후 바뀐 필드만 전송 (설명만 고쳤을 때 긴 프롬프트를 다시 보내지 않도록)
     const lastSaved = lastSavedContentRef.current;
-    const hasChanges = (
-      currentContent.promptText !== lastSaved.promptText ||
-      currentContent.systemPrompt !== lastSaved.systemPrompt ||
-      currentContent.taskDescription !== lastSaved.taskDescription
-    );
+    const updates = {};
+    if (promptText !== lastSaved.promptText) updates.content = promptText;
+    if (systemPrompt !== lastSaved.systemPrompt) updates.system_prompt = systemPrompt;
+    if (taskDescription !== lastSaved.taskDescription) updates.description = taskDescription;
     
-    if (!hasChanges) {
+    if (Object.keys(updates).length === 0) {
       return; // 변경사항이 없으면 저장하지 않음
     }
     
     try {
-      setSaveStatus('saving');
-      await updateVersion(taskId, versionId, {
-        content: promptText,
-        system_prompt: systemPrompt,
-        description: taskDescription,
-      });
+      updateSaveStatus('saving');
+      await updateVersion(taskId, versionId, updates);
       
       // 저장 완료 후 마지막 저장된 내용 업데이트
-      lastSavedContentRef.current = currentContent;
-      setSaveStatus('saved');
+      lastSavedContentRef.current = { promptText, systemPrompt, taskDescription };
+      updateSaveStatus('saved');
     } catch (error) {
-      // Auto-save failed
-      setSaveStatus('error');
-      // 5초 후 에러 상태 초기화
-      setTimeout(() => setSaveStatus('saved'), 5000);
+      // Auto-save failed - 5초 후 에러 상태 초기화
+      updateSaveStatus('error', 5000);
     }
-  }, [taskId, versionId, promptText, systemPrompt, taskDescription, updateVersion]);
+  }, [taskId, versionId, promptText, systemPrompt, taskDescription, updateVersion, updateSaveStatus]);
+
+  // 타이머 콜백은 항상 최신 handleAutoSave를 호출 (키 입력마다 스케줄러를 다시 만들지 않도록)
+  const handleAutoSaveRef = useRef(handleAutoSave);
+  handleAutoSaveRef.current = handleAutoSave;
 
   // 자동 저장 함수 (debounced)
   const scheduleAutoSave = useCallback(() => {
@@ -355,18 +606,20 @@ const PromptEditor = ({ taskId, versionId }) => {
     
     // 2초 후 자동 저장 실행
     autoSaveTimeoutRef.current = setTimeout(() => {
-      handleAutoSave();
+      autoSaveTimeoutRef.current = null;
+      handleAutoSaveRef.current();
     }, 2000);
-  }, [taskId, versionId, handleAutoSave]);
+  }, [taskId, versionId]);
 
   // blur 이벤트에서 즉시 저장
+  // ref를 통해 최신 handleAutoSave를 호출해서 키 입력마다 새 핸들러를 만들어 입력란에 넘기지 않음
   const handleBlurSave = useCallback(() => {
     if (autoSaveTimeoutRef.current) {
       clearTimeout(autoSaveTimeoutRef.current);
       autoSaveTimeoutRef.current = null;
     }
-    handleAutoSave();
-  }, [handleAutoSave]);
+    handleAutoSaveRef.current();
+  }, []);
 
   // 🚫 자동 변수 추가 기능 임시 비활성화 (변수 초기화 문제 해결을 위해)
   // TODO: 나중에 다시 활성화할 때는 로드 타이밍 문제 해결 필요
@@ -380,8 +633,22 @@ const PromptEditor = ({ taskId, versionId }) => {
   useEffect(() => {
     if (!taskId || !versionId) return;
     
+    // 버전 로드처럼 저장된 내용과 같은 값으로 바뀐 경우는 사용자 편집이 아니므로 타이머를 걸지 않음
+    const lastSaved = lastSavedContentRef.current;
+    if (
+      promptText === lastSaved.promptText &&
+      systemPrompt === lastSaved.systemPrompt &&
+      taskDescription === lastSaved.taskDescription
+    ) {
+      if (autoSaveTimeoutRef.current) {
+        clearTimeout(autoSaveTimeoutRef.current);
+        autoSaveTimeoutRef.current = null;
+      }
+      return;
+    }
+    
     // 초기 로드가 완료된 후에만 자동 저장 스케줄링
-    if (lastSavedContentRef.current.promptText !== undefined) {
+    if (lastSaved.promptText !== undefined) {
       scheduleAutoSave();
     }
   }, [promptText, systemPrompt, taskDescription, scheduleAutoSave]);
@@ -392,14 +659,22 @@ const PromptEditor = ({ taskId, versionId }) => {
       if (autoSaveTimeoutRef.current) {
         clearTimeout(autoSaveTimeoutRef.current);
       }
+      if (saveStatusTimeoutRef.current) {
+        clearTimeout(saveStatusTimeoutRef.current);
+      }
     };
   }, []);
 
 
   const handleSave = async () => {
     if (!taskId || !versionId) return;
+    // 대기 중인 자동 저장은 이번 저장에 포함되므로 취소
+    if (autoSaveTimeoutRef.current) {
+      clearTimeout(autoSaveTimeoutRef.current);
+      autoSaveTimeoutRef.current = null;
+    }
     try {
-      setSaveStatus('saving');
+      updateSaveStatus('saving');
       await updateVersion(taskId, versionId, {
         content: promptText,
         system_prompt: systemPrompt,
@@ -412,12 +687,10 @@ const PromptEditor = ({ taskId, versionId }) => {
         systemPrompt,
         taskDescription
       };
-      setSaveStatus('saved');
+      updateSaveStatus('saved');
     } catch (error) {
-      // Save failed
-      setSaveStatus('error');
-      // 3초 후 에러 상태 초기화
-      setTimeout(() => setSaveStatus('saved'), 3000);
+      // Save failed - 3초 후 에러 상태 초기화
+      updateSaveStatus('error', 3000);
     }
   };
 
@@ -425,24 +698,66 @@ const PromptEditor = ({ taskId, versionId }) => {
   const saveTaskVariables = async (newVariables) => {
     if (!taskId) return;
     try {
-      console.log('🔧 [DEBUG] PromptEditor에서 변수 저장 시작:', newVariables);
-      
       // store의 updateVariables 사용하여 상태 동기화
       await updateVariables(taskId, newVariables);
       setTaskVariables(newVariables);
-      
-      console.log('✅ PromptEditor 변수 저장 완료:', newVariables);
     } catch (error) {
       console.error('❌ PromptEditor 변수 저장 오류:', error);
     }
   };
 
+  // 대기 중인 편집을 꺼내 전체 변수 객체로 병합 (타이머도 정리)
+  const takePendingVariables = () => {
+    if (variableSaveTimeoutRef.current) {
+      clearTimeout(variableSaveTimeoutRef.current);
+      variableSaveTimeoutRef.current = null;
+    }
+    const pending = pendingVariablesRef.current;
+    if (!pending) return null;
+    pendingVariablesRef.current = null;
+    return { taskId: pending.taskId, variables: { ...pending.base, ...pending.edits }, edits: pending.edits };
+  };
+
+  // 대기 중인 변수 저장을 즉시 실행
+  const flushVariableSave = useCallback(() => {
+    const pending = takePendingVariables();
+    if (!pending) return;
+    if (pending.taskId === currentTaskIdRef.current) {
+      setTaskVariables(pending.variables);
+    }
+    updateVariableValues(pending.taskId, pending.edits);
+  }, [updateVariableValues]);
+
+  // 변수 카드 입력 처리 - 편집 내용만 기록하고 병합/저장은 debounce 후 한 번만 수행
+  const handleVariableValueChange = useCallback((variable, value) => {
+    if (!taskId) return;
+    if (!pendingVariablesRef.current) {
+      pendingVariablesRef.current = { taskId, base: taskVariablesRef.current, edits: {} };
+    }
+    pendingVariablesRef.current.edits[variable] = value;
+    if (variableSaveTimeoutRef.current) {
+      clearTimeout(variableSaveTimeoutRef.current);
+    }
+    variableSaveTimeoutRef.current = setTimeout(flushVariableSave, VARIABLE_SAVE_DELAY_MS);
+  }, [taskId, flushVariableSave]);
+
+  // Task 전환/언마운트시 대기 중인 변수 저장
+  useEffect(() => {
+    return () => flushVariableSave();
+  }, [taskId, flushVariableSave]);
+
   const handleSaveName = async () => {
-    if (!taskId || !taskName.trim()) return;
+    const trimmedName = taskName.trim();
+    if (!taskId || !trimmedName) return;
+    // 이름이 그대로면 저장할 것이 없음
+    if (trimmedName === currentTask?.name) {
+      setIsEditingName(false);
+      return;
+    }
     try {
       // This should ideally be in the store as well
       // For now, let's assume `updateTask` is still there for this purpose
-      // await updateTask(taskId, { name: taskName.trim() });
+      // await updateTask(taskId, { name: trimmedName });
       setIsEditingName(false);
     } catch (error) {
       // Name save failed
@@ -468,7 +783,7 @@ const PromptEditor = ({ taskId, versionId }) => {
 
   const handleCopyVersion = async () => {
     if (!taskId || !versionId) return;
-    const currentVersionData = currentTask?.versions?.find(v => v.id === versionId);
+    const currentVersionData = versionsById.get(versionId);
     if (!currentVersionData) return;
 
     const newName = prompt(`Enter a name for the copied version:`, `${currentVersionData.name} (Copy)`);
@@ -489,24 +804,43 @@ const PromptEditor = ({ taskId, versionId }) => {
 
   const handleAddVariable = async () => {
     if (!newVariable.name.trim()) return;
-    const updatedVariables = { ...taskVariables, [newVariable.name.trim()]: newVariable.value };
+    // 대기 중인 편집도 함께 저장
+    const pending = takePendingVariables();
+    const baseVariables = pending ? pending.variables : taskVariables;
+    const updatedVariables = { ...baseVariables, [newVariable.name.trim()]: newVariable.value };
     await saveTaskVariables(updatedVariables);
     setNewVariable({ name: '', value: '' });
   };
 
-  const handleRemoveVariable = async (variable) => {
-    const updatedVariables = { ...taskVariables };
+  const removeVariable = async (variable) => {
+    const pending = takePendingVariables();
+    const updatedVariables = { ...(pending ? pending.variables : taskVariables) };
     delete updatedVariables[variable];
     await saveTaskVariables(updatedVariables);
   };
 
-  const renderPromptWithVariables = () => {
-    let rendered = promptText;
-    displayedVariables.forEach(variable => {
-      const value = taskVariables[variable] || `{{${variable}}}`;
-      rendered = rendered.replace(new RegExp(`\{\{${variable}\}\}`, 'g'), value);
+  // memo된 변수 카드에 넘기는 삭제 핸들러는 항상 같은 참조를 유지하고 ref로 최신 함수를 호출
+  const removeVariableRef = useRef(removeVariable);
+  removeVariableRef.current = removeVariable;
+  const handleRemoveVariable = useCallback((variable) => removeVariableRef.current(variable), []);
+
+  // 미리보기 텍스트는 미리보기 모드에서 내용이 바뀐 경우에만 다시 계산
+  // 변수마다 정규식을 만들어 전체 문자열을 반복 치환하지 않고 한 번의 스캔으로 치환
+  const previewPromptText = useMemo(() => {
+    if (!isPreviewMode) return '';
+    if (!promptText || !promptText.includes('{{')) return promptText;
+    return promptText.replace(VARIABLE_TOKEN_PATTERN, (match) => {
+      const name = match.slice(2, -2);
+      const value = Object.prototype.hasOwnProperty.call(taskVariables, name) ? taskVariables[name] : '';
+      return value || match;
     });
-    return rendered;
+  }, [isPreviewMode, promptText, taskVariables]);
+
+  const togglePreviewMode = useCallback(() => setIsPreviewMode(prev => !prev), []);
+
+  const handleTabChange = (tab) => {
+    setActiveTab(tab);
+    if (tab === 'variables') setVariablesMounted(true);
   };
 
   // --- Collapse and Resize Logic ---
@@ -519,42 +853,60 @@ const PromptEditor = ({ taskId, versionId }) => {
     description: 80,
     system: 96,
   });
+  // 입력란 높이 스타일은 드래그로 높이가 바뀔 때만 새로 만듦 (키 입력마다 새 객체를 넘기지 않음)
+  const descriptionInputStyle = useMemo(() => ({ height: `${heights.description}px` }), [heights.description]);
+  const systemInputStyle = useMemo(() => ({ height: `${heights.system}px` }), [heights.system]);
   const [dragging, setDragging] = useState(null);
   const editorContainerRef = useRef(null);
+  // 드래그 시작 시 한 번만 측정한 값 (mousemove마다 레이아웃을 다시 읽지 않도록)
+  const dragStateRef = useRef(null);
 
-  const toggleSection = (section) => {
+  // 섹션 헤더/구분선 핸들러는 data-section으로 대상을 읽어서 렌더링마다 클로저를 만들지 않음
+  const toggleSection = useCallback((e) => {
+    const section = e.currentTarget.dataset.section;
     setCollapsedSections(prev => ({ ...prev, [section]: !prev[section] }));
-  };
+  }, []);
+
+  const handleDescriptionChange = useCallback((e) => setTaskDescription(e.target.value), []);
+  const handleSystemPromptChange = useCallback((e) => setSystemPrompt(e.target.value), []);
 
-  const onDragStart = (e, section) => {
+  const onDragStart = useCallback((e) => {
     e.preventDefault();
+    if (!editorContainerRef.current) return;
+    const section = e.currentTarget.dataset.section;
+    dragStateRef.current = {
+      section,
+      containerTop: editorContainerRef.current.getBoundingClientRect().top,
+      // system 영역을 드래그하는 동안 description 높이는 바뀌지 않으므로 미리 계산
+      descriptionHeight: collapsedSections.description ? 40 : heights.description
+    };
     setDragging(section);
-  };
+  }, [collapsedSections.description, heights.description]);
 
   const onDragEnd = useCallback(() => {
+    dragStateRef.current = null;
     setDragging(null);
   }, []);
 
   const onDrag = useCallback((e) => {
-    if (dragging === null || !editorContainerRef.current) return;
+    const drag = dragStateRef.current;
+    if (!drag) return;
     e.preventDefault();
 
-    const rect = editorContainerRef.current.getBoundingClientRect();
-    const y = e.clientY - rect.top;
+    const y = e.clientY - drag.containerTop;
 
-    if (dragging === 'description') {
+    if (drag.section === 'description') {
       const newHeight = y - 20; // Adjust for padding and header
       if (newHeight > 40) {
-        setHeights(h => ({ ...h, description: newHeight }));
+        setHeights(h => (h.description === newHeight ? h : { ...h, description: newHeight }));
       }
-    } else if (dragging === 'system') {
-      const descriptionHeight = collapsedSections.description ? 40 : heights.description;
-      const newHeight = y - descriptionHeight - 60; // Adjust for padding, headers, and divider
+    } else if (drag.section === 'system') {
+      const newHeight = y - drag.descriptionHeight - 60; // Adjust for padding, headers, and divider
       if (newHeight > 40) {
-        setHeights(h => ({ ...h, system: newHeight }));
+        setHeights(h => (h.system === newHeight ? h : { ...h, system: newHeight }));
       }
     }
-  }, [dragging, heights.description, collapsedSections.description]);
+  }, []);
 
   useEffect(() => {
     if (dragging !== null) {
@@ -599,7 +951,7 @@ const PromptEditor = ({ taskId, versionId }) => {
             ) : (
               <h2 
                 className="text-lg font-medium cursor-pointer hover:opacity-75 transition-opacity"
-                style={{ color: 'var(--text-primary)' }}
+                style={styles.primaryText}
                 onClick={() => setIsEditingName(true)}
                 title="Click to edit name"
               >
@@ -608,24 +960,13 @@ const PromptEditor = ({ taskId, versionId }) => {
             )}
             
             <div className="flex gap-2">
-              <div className="px-2 py-1 rounded text-xs font-medium"
-                   style={{ 
-                     background: 'rgba(16, 185, 129, 0.2)', 
-                     color: 'var(--accent-success)' 
-                   }}>
+              <div className="px-2 py-1 rounded text-xs font-medium" style={styles.activeBadge}>
                 Active
               </div>
               
               {/* 저장 상태 표시 */}
               <div className="px-2 py-1 rounded text-xs font-medium flex items-center gap-1"
-                   style={{ 
-                     background: saveStatus === 'saving' ? 'rgba(234, 179, 8, 0.2)' : 
-                                saveStatus === 'error' ? 'rgba(239, 68, 68, 0.2)' : 
-                                'rgba(107, 114, 128, 0.1)',
-                     color: saveStatus === 'saving' ? '#eab308' : 
-                           saveStatus === 'error' ? '#ef4444' : 
-                           'var(--text-muted)'
-                   }}>
+                   style={styles.saveStatus[saveStatus]}>
                 {saveStatus === 'saving' && (
                   <>
                     <span className="animate-spin">⟳</span>
@@ -660,36 +1001,24 @@ const PromptEditor = ({ taskId, versionId }) => {
 
         {/* Version Timeline */}
         {currentTask.versions && currentTask.versions.length > 0 && (
-          <div className="version-timeline">
-            <div className="timeline-line"></div>
-            {currentTask.versions.map((version, index) => (
-              <div
-                key={version.id}
-                className="timeline-item"
-                onClick={() => setCurrentVersion(version.id)}
-              >
-                <div 
-                  className={`timeline-dot ${currentVersion === version.id ? 'active' : ''}`}
-                />
-                <div className={`timeline-label ${currentVersion === version.id ? 'active' : ''}`}>
-                  {version.name || `v${index + 1}`}
-                </div>
-              </div>
-            ))}
-          </div>
+          <VersionTimeline
+            versions={currentTask.versions}
+            currentVersionId={currentVersion}
+            onSelect={setCurrentVersion}
+          />
         )}
 
         {/* Tabs */}
         <div className="tab-container mt-4">
           <button 
             className={`tab ${activeTab === 'prompt' ? 'active' : ''}`}
-            onClick={() => setActiveTab('prompt')}
+            onClick={() => handleTabChange('prompt')}
           >
             Prompt
           </button>
           <button 
             className={`tab ${activeTab === 'variables' ? 'active' : ''}`}
-            onClick={() => setActiveTab('variables')}
+            onClick={() => handleTabChange('variables')}
           >
             Variables ({displayedVariables.length})
           </button>
@@ -697,36 +1026,36 @@ const PromptEditor = ({ taskId, versionId }) => {
       </div>
 
       {/* Content */}
-      <div className="flex-1 overflow-y-auto p-4" style={{ height: 0 }}>
-        {!versionId && activeTab === 'prompt' ? (
+      <div className="flex-1 overflow-y-auto p-4" style={styles.scrollBody}>
+        {!versionId && activeTab === 'prompt' && (
           <div className="flex items-center justify-center h-full">
             <div className="text-center text-muted">
               <div className="text-2xl mb-2">☝️</div>
               <p>Select a version from the timeline above to start editing.</p>
             </div>
           </div>
-        ) : activeTab === 'prompt' ? (
+        )}
+        {/* 탭은 한 번 마운트되면 유지하고 보이기/숨기기만 전환 */}
+        {versionId && (
           /* Prompt Tab */
-          <div className="flex flex-col h-full" ref={editorContainerRef}>
+          <div className={`flex flex-col h-full ${activeTab === 'prompt' ? '' : 'hidden'}`} ref={editorContainerRef}>
             {/* Description */}
             <div className="card flex flex-col">
-              <h3 className="text-sm font-medium mb-3 flex items-center gap-2 cursor-pointer" onClick={() => toggleSection('description')}>
+              <h3 className="text-sm font-medium mb-3 flex items-center gap-2 cursor-pointer" data-section="description" onClick={toggleSection}>
                 <span className="transform transition-transform duration-200">{collapsedSections.description ? '▶' : '▼'}</span>
                 📝 Prompt Description
               </h3>
               {!collapsedSections.description && (
                 <textarea
                   value={taskDescription}
-                  onChange={(e) => setTaskDescription(e.target.value)}
+                  onChange={handleDescriptionChange}
                   onBlur={handleBlurSave}
+                  spellCheck={false}
+                  autoCorrect="off"
+                  autoCapitalize="off"
                   placeholder="Describe the purpose and usage of this prompt..."
-                  className="w-full p-3 bg-transparent border rounded text-sm"
-                  style={{
-                    height: `${heights.description}px`,
-                    borderColor: 'var(--border-primary)',
-                    color: 'var(--text-primary)',
-                    resize: 'none'
-                  }}
+                  className="prompt-section-input w-full p-3 bg-transparent border rounded text-sm"
+                  style={descriptionInputStyle}
                 />
               )}
             </div>
@@ -734,29 +1063,28 @@ const PromptEditor = ({ taskId, versionId }) => {
             {!collapsedSections.description && (
               <div 
                 className="editor-divider my-2 cursor-row-resize"
-                onMouseDown={(e) => onDragStart(e, 'description')}
+                data-section="description"
+                onMouseDown={onDragStart}
               />
             )}
 
             {/* System Prompt */}
             <div className="card flex flex-col">
-              <h3 className="text-sm font-medium mb-3 flex items-center gap-2 cursor-pointer" onClick={() => toggleSection('system')}>
+              <h3 className="text-sm font-medium mb-3 flex items-center gap-2 cursor-pointer" data-section="system" onClick={toggleSection}>
                 <span className="transform transition-transform duration-200">{collapsedSections.system ? '▶' : '▼'}</span>
                 🤖 System Prompt
               </h3>
               {!collapsedSections.system && (
                 <textarea
                   value={systemPrompt}
-                  onChange={(e) => setSystemPrompt(e.target.value)}
+                  onChange={handleSystemPromptChange}
                   onBlur={handleBlurSave}
+                  spellCheck={false}
+                  autoCorrect="off"
+                  autoCapitalize="off"
                   placeholder="Define AI role and instructions..."
-                  className="w-full p-3 bg-transparent border rounded text-sm"
-                  style={{
-                    height: `${heights.system}px`,
-                    borderColor: 'var(--border-primary)',
-                    color: 'var(--text-primary)',
-                    resize: 'none'
-                  }}
+                  className="prompt-section-input w-full p-3 bg-transparent border rounded text-sm"
+                  style={systemInputStyle}
                 />
               )}
             </div>
@@ -764,13 +1092,14 @@ const PromptEditor = ({ taskId, versionId }) => {
             {!collapsedSections.system && (
                <div 
                 className="editor-divider my-2 cursor-row-resize"
-                onMouseDown={(e) => onDragStart(e, 'system')}
+                data-section="system"
+                onMouseDown={onDragStart}
               />
             )}
 
             {/* Main Prompt */}
             <div className="card flex flex-col flex-1">
-              <h3 className="text-sm font-medium mb-3 flex items-center gap-2 cursor-pointer" onClick={() => toggleSection('main')}>
+              <h3 className="text-sm font-medium mb-3 flex items-center gap-2 cursor-pointer" data-section="main" onClick={toggleSection}>
                 <span className="transform transition-transform duration-200">{collapsedSections.main ? '▶' : '▼'}</span>
                 💬 Main Prompt
               </h3>
@@ -781,12 +1110,7 @@ const PromptEditor = ({ taskId, versionId }) => {
                   onBlur={handleBlurSave}
                   placeholder="Enter prompt... (Use {{variable_name}} for variables)"
                   className="w-full h-full p-3 text-sm flex-1"
-                  style={{
-                    color: 'var(--text-primary)',
-                    fontFamily: 'inherit',
-                    lineHeight: '1.5',
-                    minHeight: '200px'
-                  }}
+                  style={styles.mainPromptEditor}
                 />
               )}
             </div>
@@ -797,35 +1121,28 @@ const PromptEditor = ({ taskId, versionId }) => {
                 <h4 className="text-sm font-medium mb-3">Preview</h4>
                 
                 {systemPrompt && (
-                  <div className="mb-4 p-3 rounded border"
-                       style={{ 
-                         background: 'rgba(16, 185, 129, 0.1)',
-                         borderColor: 'var(--accent-success)'
-                       }}>
-                    <div className="text-xs mb-2" style={{ color: 'var(--accent-success)' }}>
+                  <div className="mb-4 p-3 rounded border" style={styles.previewSystemBox}>
+                    <div className="text-xs mb-2" style={styles.previewSystemLabel}>
                       System:
                     </div>
-                    <pre className="whitespace-pre-wrap text-sm" style={{ color: 'var(--text-secondary)' }}>
+                    <pre className="whitespace-pre-wrap text-sm" style={styles.previewText}>
                       {systemPrompt}
                     </pre>
                   </div>
                 )}
                 
-                <div className="p-3 rounded border" 
-                     style={{ 
-                       background: 'var(--bg-tertiary)',
-                       borderColor: 'var(--border-primary)'
-                     }}>
-                  <pre className="whitespace-pre-wrap text-sm font-mono" style={{ color: 'var(--text-secondary)' }}>
-                    {renderPromptWithVariables()}
+                <div className="p-3 rounded border" style={styles.previewPromptBox}>
+                  <pre className="whitespace-pre-wrap text-sm font-mono" style={styles.previewText}>
+                    {previewPromptText}
                   </pre>
                 </div>
               </div>
             )}
           </div>
-        ) : (
+        )}
+        {variablesMounted && (
           /* Variables Tab */
-          <div className="space-y-4">
+          <div className={`space-y-4 ${activeTab === 'variables' ? '' : 'hidden'}`}>
 
             {/* Add Variable */}
             <div className="card">
@@ -842,15 +1159,18 @@ const PromptEditor = ({ taskId, versionId }) => {
                   <textarea
                     value={newVariable.value}
                     onChange={(e) => setNewVariable(prev => ({ ...prev, value: e.target.value }))}
+                    spellCheck={false}
+                    autoCorrect="off"
+                    autoCapitalize="off"
                     className="input text-sm flex-1"
                     placeholder="Variable Value (supports multiline text, documents, etc.)"
                     rows="3"
-                    style={{ resize: 'vertical', minHeight: '60px' }}
+                    style={styles.newVariableInput}
                   />
                   <button 
                     className="btn btn-primary" 
                     onClick={handleAddVariable}
-                    style={{ alignSelf: 'flex-start', minWidth: '60px' }}
+                    style={styles.addVariableButton}
                   >
                     Add
                   </button>
@@ -861,74 +1181,21 @@ const PromptEditor = ({ taskId, versionId }) => {
             {/* Variable List */}
             <div className="space-y-3">
               {displayedVariables.length === 0 ? (
-                <div className="text-center py-8" style={{ color: 'var(--text-muted)' }}>
+                <div className="text-center py-8" style={styles.mutedText}>
                   <p>No variables in prompt.</p>
                   <p className="text-xs mt-1">Use <code>{'{{'}variable_name{'}}'}</code> format in your prompt.</p>
                 </div>
               ) : (
                 displayedVariables.map(variable => (
-                  <div key={variable} className="card">
-                    <div className="flex items-start gap-3">
-                      <div className="flex-shrink-0 pt-2">
-                        <span className="variable-badge">{`{{${variable}}}`}</span>
-                      </div>
-                      <div className="flex-1">
-                        <label className="block text-xs mb-1" style={{ color: 'var(--text-muted)' }}>
-                          {variable}
-                        </label>
-                        <textarea
-                          value={taskVariables[variable] || ''}
-                          onChange={(e) => {
-                            const updatedVariables = { ...taskVariables, [variable]: e.target.value };
-                            setTaskVariables(updatedVariables);
-                            // Auto-save after a delay could be added here
-                          }}
-                          onBlur={(e) => {
-                            // Save on blur for better UX
-                            const updatedVariables = { ...taskVariables, [variable]: e.target.value };
-                            saveTaskVariables(updatedVariables);
-                          }}
-                          className="w-full p-2 border rounded text-sm"
-                          style={{ 
-                            borderColor: 'var(--border-primary)',
-                            background: 'var(--bg-tertiary)',
-                            color: 'var(--text-primary)',
-                            resize: 'vertical',
-                            minHeight: '80px'
-                          }}
-                          placeholder={`Enter value for ${variable}... (supports multiline text)`}
-                          rows="3"
-                        />
-                      </div>
-                      <button
-                        className="flex-shrink-0 text-xs px-2 py-1 rounded transition-colors"
-                        style={{ 
-                          color: extractedVariables.includes(variable) ? 'var(--text-muted)' : 'var(--accent-danger)',
-                          background: 'transparent',
-                          border: `1px solid ${extractedVariables.includes(variable) ? 'var(--border-primary)' : 'var(--accent-danger)'}`,
-                          marginTop: '20px',
-                          cursor: extractedVariables.includes(variable) ? 'not-allowed' : 'pointer'
-                        }}
-                        onClick={() => handleRemoveVariable(variable)}
-                        disabled={extractedVariables.includes(variable)}
-                        title={extractedVariables.includes(variable) ? "Variable is used in a prompt and cannot be deleted." : "Delete variable"}
-                        onMouseEnter={(e) => {
-                          if (!extractedVariables.includes(variable)) {
-                            e.target.style.background = 'var(--accent-danger)';
-                            e.target.style.color = 'white';
-                          }
-                        }}
-                        onMouseLeave={(e) => {
-                          if (!extractedVariables.includes(variable)) {
-                            e.target.style.background = 'transparent';
-                            e.target.style.color = 'var(--accent-danger)';
-                          }
-                        }}
-                      >
-                        Delete
-                      </button>
-                    </div>
-                  </div>
+                  <VariableCard
+                    key={variable}
+                    name={variable}
+                    value={taskVariables[variable] || ''}
+                    isUsed={usedVariables.has(variable)}
+                    onValueChange={handleVariableValueChange}
+                    onCommit={flushVariableSave}
+                    onRemove={handleRemoveVariable}
+                  />
                 ))
               )}
             </div>
@@ -937,10 +1204,10 @@ const PromptEditor = ({ taskId, versionId }) => {
       </div>
 
       {/* Bottom Actions */}
-      <div className="flex gap-2 p-4 border-t" style={{ borderColor: 'var(--border-primary)' }}>
+      <div className="flex gap-2 p-4 border-t" style={styles.footer}>
         <button 
           className="btn btn-secondary flex-1"
-          onClick={() => setIsPreviewMode(!isPreviewMode)}
+          onClick={togglePreviewMode}
         >
           👁️ {isPreviewMode ? 'Edit Mode' : 'Preview'}
         </button>
@@ -1,5 +1,5 @@
 // src/frontend/components/result/ResultViewer.jsx
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef, useMemo } from 'react';
 import { useStore } from '../../store.jsx';
 
 // Helper component for collapsible content
@@ -41,16 +41,216 @@ const CollapsibleContent = ({ title, content }) => {
   );
 };
 
+// History 탭에 한 번에 렌더링할 항목 수
+const HISTORY_PAGE_SIZE = 15;
+
+// 히스토리 미리보기는 line-clamp(2줄)로 잘라 표시하므로, 아주 긴 응답만 DOM에 넣기 전에 길이를 제한
+const HISTORY_PREVIEW_MAX_CHARS = 400;
+const getHistoryPreview = (result) => {
+  const content = result.output?.choices?.[0]?.message?.content || result.output?.content;
+  if (!content) return 'No response content';
+  return content.length > HISTORY_PREVIEW_MAX_CHARS ? content.slice(0, HISTORY_PREVIEW_MAX_CHARS) : content;
+};
+
+// 결과 객체 -> 표시용 날짜 문자열 캐시 (같은 기록을 렌더링마다 다시 파싱/포맷하지 않음)
+// 결과 객체를 키로 하는 WeakMap이라 기록이 사라지면 캐시 항목도 함께 정리됨
+const formattedTimestampCache = new WeakMap();
+
+const formatResultTimestamp = (result) => {
+  let formatted = formattedTimestampCache.get(result);
+  if (formatted === undefined) {
+    formatted = new Date(result.timestamp).toLocaleString();
+    formattedTimestampCache.set(result, formatted);
+  }
+  return formatted;
+};
+
+// 실행 시 입력 데이터로 보낼 변수 토큰 ({{name}}) - 실행마다 정규식을 새로 만들지 않도록 한 번만 생성
+const RUN_VARIABLE_PATTERN = /\{\{(\w+)\}\}/g;
+
+// 렌더링마다 새로 만들지 않도록 자주 쓰는 인라인 스타일 객체를 모듈 레벨에 둠
+const styles = {
+  mutedText: { color: 'var(--text-muted)' },
+  dimText: { color: 'var(--text-dim)' },
+  primaryText: { color: 'var(--text-primary)' },
+  secondaryText: { color: 'var(--text-secondary)' },
+  accentText: { color: 'var(--accent-primary)' },
+  endpointBox: { background: 'rgba(139, 92, 246, 0.1)', border: '1px solid var(--accent-primary)' },
+  runButton: { background: 'var(--accent-primary)', color: 'white', border: 'none' },
+  avatar: { background: 'var(--accent-primary)', color: 'white' },
+  errorBox: { background: 'rgba(239, 68, 68, 0.1)', borderColor: 'var(--accent-danger)', color: 'var(--accent-danger)' },
+  responseBody: { color: 'var(--text-secondary)', lineHeight: '1.6' },
+};
+
+// 모델별 1K 토큰당 비용
+const MODEL_COSTS = {
+  'gpt-4o': { input: 0.0025, output: 0.01 },
+  'gpt-4': { input: 0.03, output: 0.06 },
+  'gpt-3.5-turbo': { input: 0.001, output: 0.002 },
+  'claude-3-opus': { input: 0.015, output: 0.075 },
+  'claude-3-sonnet': { input: 0.003, output: 0.015 },
+  'claude-3-haiku': { input: 0.00025, output: 0.00125 },
+};
+
+const calculateTokens = (text) => {
+  if (!text) return 0;
+  return Math.ceil(text.length / 4);
+};
+
+// History 항목별 토큰 수 캐시 - 저장된 결과 객체는 바뀌지 않으므로 객체 자체를 키로 사용
+// (목록이 다시 렌더링될 때마다 입력 변수를 다시 직렬화하지 않음)
+const resultTokenCache = new WeakMap();
+const getResultTokenCount = (result) => {
+  let tokens = resultTokenCache.get(result);
+  if (tokens === undefined) {
+    tokens = calculateTokens(JSON.stringify(result.inputData) +
+                             (result.output?.choices?.[0]?.message?.content || result.output?.content || ''));
+    resultTokenCache.set(result, tokens);
+  }
+  return tokens;
+};
+
+const calculateCost = (inputTokens, outputTokens, model) => {
+  const modelCost = MODEL_COSTS[model] || MODEL_COSTS['gpt-3.5-turbo'];
+  const totalCost = (inputTokens / 1000 * modelCost.input) + (outputTokens / 1000 * modelCost.output);
+  return `$${totalCost.toFixed(4)}`;
+};
+
+// History detail panel - 모듈 레벨에 두어 ResultViewer 렌더링마다 새 컴포넌트 타입이 생기지 않도록 함
+const HistoryDetailView = ({ result, version, renderPrompt }) => {
+  if (!result) {
+    return (
+      <div className="flex items-center justify-center h-full text-center">
+        <div>
+          <div className="text-2xl mb-2">🔍</div>
+          <p style={styles.mutedText}>Select a history item to see details</p>
+        </div>
+      </div>
+    );
+  }
+
+  const responseContent = result.output?.choices?.[0]?.message?.content || result.output?.content || 'No content';
+  const renderedUserPrompt = renderPrompt(version.content, result.inputData);
+  const requestMessage = `---------- System Prompt ----------\n${version.system_prompt}\n\n---------- User Prompt ----------\n${renderedUserPrompt}`;
+
+  return (
+    <div className="p-4 space-y-4">
+      <CollapsibleContent title="Request Message" content={requestMessage} />
+      <CollapsibleContent title="Response" content={responseContent} />
+      
+      <div>
+        <h3 className="text-sm font-medium text-gray-500 dark:text-gray-400 mb-2">Metrics</h3>
+        <div className="grid grid-cols-2 gap-3">
+          {(() => {
+            const inputContent = JSON.stringify(result.inputData);
+            const inputTokens = calculateTokens(requestMessage);
+            const outputTokens = calculateTokens(responseContent);
+            const totalTokens = inputTokens + outputTokens;
+            const estimatedCost = calculateCost(inputTokens, outputTokens, result.endpoint?.defaultModel);
+            return (
+              <>
+                <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
+                  <div className="text-xs text-gray-500 dark:text-gray-400">Model</div>
+                  <div className="text-md font-semibold truncate">{result.endpoint?.defaultModel || result.endpoint?.name || 'Unknown'}</div>
+                </div>
+                <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
+                  <div className="text-xs text-gray-500 dark:text-gray-400">Tokens Used</div>
+                  <div className="text-md font-semibold">{totalTokens.toLocaleString()}</div>
+                  <div className="text-xs text-gray-400 dark:text-gray-500">{inputTokens} in, {outputTokens} out</div>
+                </div>
+                <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900 col-span-2">
+                  <div className="text-xs text-gray-500 dark:text-gray-400">Estimated Cost</div>
+                  <div className="text-md font-semibold">{estimatedCost}</div>
+                </div>
+              </>
+            );
+          })()}
+        </div>
+      </div>
+      <div>
+        <h3 className="text-sm font-medium text-gray-500 dark:text-gray-400 mb-2">Input Variables</h3>
+        <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
+          <pre className="text-xs whitespace-pre-wrap">
+            {JSON.stringify(result.inputData, null, 2)}
+          </pre>
+        </div>
+      </div>
+      <div>
+        <h3 className="text-sm font-medium text-gray-500 dark:text-gray-400 mb-2">Raw Output</h3>
+        <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
+          <pre className="text-xs whitespace-pre-wrap">
+            {JSON.stringify(result.output, null, 2)}
+          </pre>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+// 패널 전체를 차지하는 안내 상태 (Task 미선택 / LLM 미설정 공용)
+const CenteredState = ({ icon, message, hint }) => (
+  <div className="flex items-center justify-center h-full">
+    <div className="text-center text-muted">
+      <div className="text-4xl mb-4">{icon}</div>
+      <p className={hint ? 'mb-2' : undefined}>{message}</p>
+      {hint && <p className="text-xs">{hint}</p>}
+    </div>
+  </div>
+);
+
+// History list item - 선택/삭제 시 변경된 항목만 다시 렌더링되도록 memo 처리
+const HistoryItem = React.memo(({ result, runNumber, isSelected, onSelect, onDelete }) => (
+  <div className={`card cursor-pointer hover:bg-opacity-80 transition-all relative group ${isSelected ? 'ring-2 ring-purple-500' : ''}`}
+       onClick={() => onSelect(result)}>
+    <button 
+      onClick={(e) => onDelete(e, result.timestamp)}
+      className="history-item-delete absolute top-2 right-2 p-1 rounded-full hover:bg-red-500 hover:text-white opacity-0 group-hover:opacity-100 transition-opacity"
+      title="Delete history item"
+    >
+      <svg xmlns="http://www.w3.org/2000/svg" className="h-4 w-4" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+        <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M6 18L18 6M6 6l12 12" />
+      </svg>
+    </button>
+    <div className="flex items-start gap-3">
+      <div className="history-run-badge w-6 h-6 rounded-full flex items-center justify-center text-xs">
+        {runNumber}
+      </div>
+      <div className="flex-1 min-w-0">
+        <div className="flex items-center justify-between mb-2">
+          <div className="history-run-title text-sm font-medium">
+            Run #{runNumber}
+          </div>
+          <div className="text-muted text-xs">
+            {formatResultTimestamp(result)}
+          </div>
+        </div>
+        <div className="history-preview text-sm line-clamp-2 mb-2">
+          {getHistoryPreview(result)}
+        </div>
+        <div className="history-meta flex gap-4 text-xs items-center">
+          <span>
+            {getResultTokenCount(result)} tokens
+          </span>
+          {(result.endpoint?.defaultModel || result.endpoint?.name) && (
+            <span className="history-model-tag font-mono p-1 rounded text-xs">
+              {result.endpoint?.defaultModel || result.endpoint?.name}
+            </span>
+          )}
+        </div>
+      </div>
+    </div>
+  </div>
+));
 
 const ResultViewer = ({ taskId, versionId }) => {
   const { 
     tasks, 
-    llmEndpoints, 
-    activeLlmEndpointId,
+    activeLlmEndpoint,
     callLLM,
     getVersionResults,
     deleteHistoryItem,
-    renderPrompt
+    renderPrompt,
+    versionsById
   } = useStore();
   
   const [activeTab, setActiveTab] = useState('response');
@@ -58,10 +258,11 @@ const ResultViewer = ({ taskId, versionId }) => {
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
   const [selectedHistoryItem, setSelectedHistoryItem] = useState(null);
+  const [visibleHistoryCount, setVisibleHistoryCount] = useState(HISTORY_PAGE_SIZE);
 
   const currentTask = taskId ? tasks[taskId] : null;
-  const currentVersion = currentTask?.versions?.find(v => v.id === versionId);
-  const activeEndpoint = llmEndpoints.find(ep => ep.id === activeLlmEndpointId);
+  const currentVersion = versionsById.get(versionId);
+  const activeEndpoint = activeLlmEndpoint;
   
   const versionResults = getVersionResults(taskId, versionId);
   const latestResult = versionResults?.[0];
@@ -76,66 +277,75 @@ const ResultViewer = ({ taskId, versionId }) => {
     setSelectedHistoryItem(null);
   }, [latestResult, versionId]);
 
+  // 토큰/비용 추정은 표시할 결과가 바뀔 때만 계산 (store 갱신으로 인한 재렌더링마다 입력을 다시 직렬화하지 않음)
+  const currentResultUsage = useMemo(() => {
+    if (!currentResult) return null;
+    const responseContent = currentResult.output?.choices?.[0]?.message?.content || currentResult.output?.content || '';
+    const inputTokens = calculateTokens(JSON.stringify(currentResult.inputData));
+    const outputTokens = calculateTokens(responseContent);
+    return {
+      inputTokens,
+      outputTokens,
+      totalTokens: inputTokens + outputTokens,
+      estimatedCost: calculateCost(inputTokens, outputTokens, currentResult.endpoint?.defaultModel)
+    };
+  }, [currentResult]);
+
+  // 실행 요청 번호 - 버전을 바꾸거나 다시 실행하면 이전 응답은 화면에 반영하지 않음
+  // (결과 자체는 store에서 해당 버전에 기록됨)
+  const runRequestIdRef = useRef(0);
+
+  useEffect(() => {
+    setVisibleHistoryCount(HISTORY_PAGE_SIZE);
+    runRequestIdRef.current += 1;
+    setIsLoading(false);
+  }, [versionId]);
+
   const handleRunPrompt = useCallback(async () => {
-    console.log('🔧 [DEBUG] handleRunPrompt 시작 검증:');
-    console.log('  - currentTask:', !!currentTask, currentTask?.id);
-    console.log('  - currentVersion:', !!currentVersion, currentVersion?.id);
-    console.log('  - activeEndpoint:', !!activeEndpoint, activeEndpoint?.id, activeEndpoint?.name);
-    console.log('  - activeLlmEndpointId:', activeLlmEndpointId);
-    
     if (!currentTask || !currentVersion || !activeEndpoint) {
-      console.log('❌ [ERROR] 필수 요소 누락:', {
-        hasTask: !!currentTask,
-        hasVersion: !!currentVersion, 
-        hasActiveEndpoint: !!activeEndpoint
-      });
       setError('Task, version, or LLM endpoint not available');
       return;
     }
+    const requestId = ++runRequestIdRef.current;
+    const isStale = () => requestId !== runRequestIdRef.current;
     setIsLoading(true);
     setError(null);
     try {
-      console.log('🔧 [DEBUG] Run Prompt 시작 - Current Version:', {
-        id: currentVersion.id,
-        name: currentVersion.name,
-        content: currentVersion.content,
-        system_prompt: currentVersion.system_prompt,
-        variables: currentVersion.variables
-      });
-      
       // Task 레벨과 Version 레벨 변수를 모두 고려
       const taskVariables = currentTask.variables || {};
       const versionVariables = currentVersion.variables || {};
       const variables = { ...taskVariables, ...versionVariables }; // Version 변수가 Task 변수를 오버라이드
       
-      console.log('🔧 [DEBUG] Task 레벨 변수들:', taskVariables);
-      console.log('🔧 [DEBUG] Version 레벨 변수들:', versionVariables);
-      console.log('🔧 [DEBUG] 최종 병합된 변수들:', variables);
-      console.log('🔧 [DEBUG] variables 객체의 키들:', Object.keys(variables));
-      console.log('🔧 [DEBUG] variables 객체의 값들:', Object.values(variables));
-      
       const inputData = {};
-      const matches = currentVersion.content?.match(/\{\{(\w+)\}\}/g) || [];
-      console.log('🔧 [DEBUG] 프롬프트에서 추출된 매치:', matches);
-      
+      const matches = currentVersion.content?.match(RUN_VARIABLE_PATTERN) || [];
       const extractedVars = [...new Set(matches.map(match => match.slice(2, -2)))];
-      console.log('🔧 [DEBUG] 추출된 변수 이름들:', extractedVars);
       
       extractedVars.forEach(variable => {
-        console.log(`🔧 [DEBUG] 변수 '${variable}' 처리:`);
-        console.log(`  - variables에 '${variable}' 키 존재 여부:`, variable in variables);
-        console.log(`  - variables['${variable}'] 값:`, variables[variable]);
-        console.log(`  - typeof variables['${variable}']:`, typeof variables[variable]);
-        
-        const value = variables[variable] || `[${variable}]`;
-        inputData[variable] = value;
-        console.log(`  - 최종 치환 결과: {{${variable}}} -> "${value}"`);
+        inputData[variable] = variables[variable] || `[${variable}]`;
       });
       
-      console.log('🔧 [DEBUG] 최종 inputData:', inputData);
-      console.log('🔧 [DEBUG] LLM 호출 시작 - Endpoint:', activeEndpoint);
-      
-      const result = await callLLM(taskId, versionId, inputData, currentVersion.system_prompt);
+      // 스트리밍 조각은 모아 두었다가 프레임당 한 번만 화면에 반영
+      const startedAt = new Date().toISOString();
+      let streamedContent = '';
+      let frameId = null;
+      const flushStreamedContent = () => {
+        frameId = null;
+        if (isStale()) return;
+        setCurrentResult({
+          inputData,
+          output: { content: streamedContent },
+          timestamp: startedAt,
+          endpoint: activeEndpoint
+        });
+      };
+      const handleDelta = (delta) => {
+        streamedContent += delta;
+        if (frameId === null) frameId = requestAnimationFrame(flushStreamedContent);
+      };
+
+      const result = await callLLM(taskId, versionId, inputData, currentVersion.system_prompt, handleDelta)
+        .finally(() => { if (frameId !== null) cancelAnimationFrame(frameId); });
+      if (isStale()) return;
       const formattedResult = {
         inputData,
         output: result,
@@ -143,143 +353,42 @@ const ResultViewer = ({ taskId, versionId }) => {
         endpoint: activeEndpoint
       };
       
-      console.log('🔧 [DEBUG] LLM 호출 완료 - 결과:', result);
       setCurrentResult(formattedResult);
     } catch (err) {
       console.error('❌ [ERROR] Run Prompt 실패:', err);
-      setError(err.message || 'Failed to call LLM API');
+      if (!isStale()) setError(err.message || 'Failed to call LLM API');
     } finally {
-      setIsLoading(false);
+      if (!isStale()) setIsLoading(false);
     }
   }, [currentTask, currentVersion, activeEndpoint, callLLM, taskId, versionId]);
 
-  const calculateTokens = useCallback((text) => {
-    if (!text) return 0;
-    return Math.ceil(text.length / 4);
-  }, []);
-
-  const calculateCost = useCallback((inputTokens, outputTokens, model) => {
-    const costs = {
-      'gpt-4o': { input: 0.0025, output: 0.01 },
-      'gpt-4': { input: 0.03, output: 0.06 },
-      'gpt-3.5-turbo': { input: 0.001, output: 0.002 },
-      'claude-3-opus': { input: 0.015, output: 0.075 },
-      'claude-3-sonnet': { input: 0.003, output: 0.015 },
-      'claude-3-haiku': { input: 0.00025, output: 0.00125 },
-    };
-    const modelCost = costs[model] || costs['gpt-3.5-turbo'];
-    const totalCost = (inputTokens / 1000 * modelCost.input) + (outputTokens / 1000 * modelCost.output);
-    return `$${totalCost.toFixed(4)}`;
-  }, []);
-
-  const handleDeleteHistory = async (e, timestamp) => {
+  const handleDeleteHistory = useCallback(async (e, timestamp) => {
     e.stopPropagation();
     if (window.confirm('Are you sure you want to delete this history item?')) {
       try {
-        if (selectedHistoryItem?.timestamp === timestamp) {
-          setSelectedHistoryItem(null);
-        }
+        setSelectedHistoryItem(prev => (prev?.timestamp === timestamp ? null : prev));
         await deleteHistoryItem(taskId, versionId, timestamp);
       } catch (error) {
         console.error("Failed to delete history item:", error);
         alert("Error: Could not delete the item.");
       }
     }
-  };
+  }, [taskId, versionId, deleteHistoryItem]);
 
   if (!currentTask) {
-    return (
-      <div className="flex items-center justify-center h-full">
-        <div className="text-center" style={{ color: 'var(--text-muted)' }}>
-          <div className="text-4xl mb-4">📝</div>
-          <p>Please select a task</p>
-        </div>
-      </div>
-    );
+    return <CenteredState icon="📝" message="Please select a task" />;
   }
 
   if (!activeEndpoint) {
     return (
-      <div className="flex items-center justify-center h-full">
-        <div className="text-center" style={{ color: 'var(--text-muted)' }}>
-          <div className="text-4xl mb-4">⚙️</div>
-          <p className="mb-2">No LLM provider configured</p>
-          <p className="text-xs">Please configure an LLM provider in settings</p>
-        </div>
-      </div>
+      <CenteredState
+        icon="⚙️"
+        message="No LLM provider configured"
+        hint="Please configure an LLM provider in settings"
+      />
     );
   }
 
-  const HistoryDetailView = ({ result, version }) => {
-    if (!result) {
-      return (
-        <div className="flex items-center justify-center h-full text-center">
-          <div>
-            <div className="text-2xl mb-2">🔍</div>
-            <p style={{ color: 'var(--text-muted)' }}>Select a history item to see details</p>
-          </div>
-        </div>
-      );
-    }
-
-    const responseContent = result.output?.choices?.[0]?.message?.content || result.output?.content || 'No content';
-    const renderedUserPrompt = renderPrompt(version.content, result.inputData);
-    const requestMessage = `---------- System Prompt ----------\n${version.system_prompt}\n\n---------- User Prompt ----------\n${renderedUserPrompt}`;
-
-    return (
-      <div className="p-4 space-y-4">
-        <CollapsibleContent title="Request Message" content={requestMessage} />
-        <CollapsibleContent title="Response" content={responseContent} />
-        
-        <div>
-          <h3 className="text-sm font-medium text-gray-500 dark:text-gray-400 mb-2">Metrics</h3>
-          <div className="grid grid-cols-2 gap-3">
-            {(() => {
-              const inputContent = JSON.stringify(result.inputData);
-              const inputTokens = calculateTokens(requestMessage);
-              const outputTokens = calculateTokens(responseContent);
-              const totalTokens = inputTokens + outputTokens;
-              const estimatedCost = calculateCost(inputTokens, outputTokens, result.endpoint?.defaultModel);
-              return (
-                <>
-                  <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
-                    <div className="text-xs text-gray-500 dark:text-gray-400">Model</div>
-                    <div className="text-md font-semibold truncate">{result.endpoint?.defaultModel || result.endpoint?.name || 'Unknown'}</div>
-                  </div>
-                  <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
-                    <div className="text-xs text-gray-500 dark:text-gray-400">Tokens Used</div>
-                    <div className="text-md font-semibold">{totalTokens.toLocaleString()}</div>
-                    <div className="text-xs text-gray-400 dark:text-gray-500">{inputTokens} in, {outputTokens} out</div>
-                  </div>
-                  <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900 col-span-2">
-                    <div className="text-xs text-gray-500 dark:text-gray-400">Estimated Cost</div>
-                    <div className="text-md font-semibold">{estimatedCost}</div>
-                  </div>
-                </>
-              );
-            })()}
-          </div>
-        </div>
-        <div>
-          <h3 className="text-sm font-medium text-gray-500 dark:text-gray-400 mb-2">Input Variables</h3>
-          <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
-            <pre className="text-xs whitespace-pre-wrap">
-              {JSON.stringify(result.inputData, null, 2)}
-            </pre>
-          </div>
-        </div>
-        <div>
-          <h3 className="text-sm font-medium text-gray-500 dark:text-gray-400 mb-2">Raw Output</h3>
-          <div className="p-3 rounded-md bg-gray-50 dark:bg-gray-900">
-            <pre className="text-xs whitespace-pre-wrap">
-              {JSON.stringify(result.output, null, 2)}
-            </pre>
-          </div>
-        </div>
-      </div>
-    );
-  };
-
   return (
     <div className="flex flex-col h-full">
       {/* Header */}
@@ -288,13 +397,13 @@ const ResultViewer = ({ taskId, versionId }) => {
           <h2 className="panel-title">Result</h2>
           <div className="flex items-center gap-2">
             {isLoading && (
-              <div className="flex items-center gap-1 text-xs" style={{ color: 'var(--text-muted)' }}>
+              <div className="flex items-center gap-1 text-xs" style={styles.mutedText}>
                 <div className="w-3 h-3 border-2 border-current border-t-transparent rounded-full animate-spin"></div>
                 Running...
               </div>
             )}
             {currentResult && !isLoading && (
-              <span className="text-xs" style={{ color: 'var(--text-muted)' }}>
+              <span className="text-xs" style={styles.mutedText}>
                 {new Date(currentResult.timestamp).toLocaleTimeString()}
               </span>
             )}
@@ -302,13 +411,13 @@ const ResultViewer = ({ taskId, versionId }) => {
         </div>
 
         <div className="flex items-center gap-2 mb-4 p-2 rounded" 
-             style={{ background: 'rgba(139, 92, 246, 0.1)', border: '1px solid var(--accent-primary)' }}>
+             style={styles.endpointBox}>
           <div className="w-2 h-2 rounded-full bg-green-500"></div>
-          <span className="text-xs font-medium" style={{ color: 'var(--accent-primary)' }}>
+          <span className="text-xs font-medium" style={styles.accentText}>
             {activeEndpoint.name}
           </span>
           {activeEndpoint.defaultModel && (
-            <span className="text-xs" style={{ color: 'var(--text-muted)' }}>
+            <span className="text-xs" style={styles.mutedText}>
               • {activeEndpoint.defaultModel}
             </span>
           )}
@@ -326,12 +435,12 @@ const ResultViewer = ({ taskId, versionId }) => {
       <div className="flex-1 overflow-hidden">
         {activeTab === 'response' && (
           <div className="overflow-y-auto p-5 h-full space-y-4">
-            <button onClick={handleRunPrompt} disabled={isLoading || !currentVersion} className={`w-full flex items-center justify-center gap-2 px-4 py-3 rounded-lg text-sm font-medium transition-all duration-200 ${isLoading ? 'opacity-50 cursor-not-allowed' : 'hover:shadow-lg'}`} style={{ background: 'var(--accent-primary)', color: 'white', border: 'none' }}>
+            <button onClick={handleRunPrompt} disabled={isLoading || !currentVersion} className={`w-full flex items-center justify-center gap-2 px-4 py-3 rounded-lg text-sm font-medium transition-all duration-200 ${isLoading ? 'opacity-50 cursor-not-allowed' : 'hover:shadow-lg'}`} style={styles.runButton}>
               {isLoading ? (<> <svg className="animate-spin w-4 h-4" fill="none" viewBox="0 0 24 24"> <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4"></circle> <path className="opacity-75" fill="currentColor" d="m4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path> </svg> Running Prompt... </>) : (<> <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"> <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M13 10V3L4 14h7v7l9-11h-7z" /> </svg> Run Prompt </>)}
             </button>
-            {error && (<div className="p-4 rounded-lg border" style={{ background: 'rgba(239, 68, 68, 0.1)', borderColor: 'var(--accent-danger)', color: 'var(--accent-danger)' }}> <div className="flex items-center gap-2 mb-2"> <svg className="w-4 h-4" fill="currentColor" viewBox="0 0 20 20"> <path fillRule="evenodd" d="M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7 4a1 1 0 11-2 0 1 1 0 012 0zm-1-9a1 1 0 00-1 1v4a1 1 0 102 0V6a1 1 0 00-1-1z" clipRule="evenodd" /> </svg> <span className="font-medium text-sm">Error</span> </div> <p className="text-sm">{error}</p> </div>)}
-            {currentResult && (<> <div className="card"> <div className="flex items-start gap-3 mb-4"> <div className="w-7 h-7 rounded-full flex items-center justify-center text-xs" style={{ background: 'var(--accent-primary)', color: 'white' }}> 🤖 </div> <div className="flex-1 min-w-0"> <div className="flex items-center justify-between mb-1"> <div className="font-medium text-sm" style={{ color: 'var(--text-primary)' }}> {currentResult.endpoint?.name || 'AI'} Response </div> <div className="text-xs" style={{ color: 'var(--text-muted)' }}> {new Date(currentResult.timestamp).toLocaleString()} </div> </div> {currentResult.endpoint?.defaultModel && (<div className="text-xs" style={{ color: 'var(--text-muted)' }}> {currentResult.endpoint.defaultModel} </div>)} </div> </div> <div className="prose prose-sm max-w-none"> <div style={{ color: 'var(--text-secondary)', lineHeight: '1.6' }}> {currentResult.output?.choices?.[0]?.message?.content ? (<div className="whitespace-pre-wrap"> {currentResult.output.choices[0].message.content} </div>) : currentResult.output?.content ? (<div className="whitespace-pre-wrap"> {currentResult.output.content} </div>) : (<div style={{ color: 'var(--text-muted)' }}> No response content available </div>)} </div> </div> </div> {(() => { const responseContent = currentResult.output?.choices?.[0]?.message?.content || currentResult.output?.content || ''; const inputContent = JSON.stringify(currentResult.inputData); const inputTokens = calculateTokens(inputContent); const outputTokens = calculateTokens(responseContent); const totalTokens = inputTokens + outputTokens; const estimatedCost = calculateCost(inputTokens, outputTokens, currentResult.endpoint?.defaultModel); return (<div className="grid grid-cols-2 gap-4"> <div className="metric-card primary"> <div className="metric-label">Tokens Used</div> <div className="metric-value primary">{totalTokens.toLocaleString()}</div> <div className="text-xs mt-1" style={{ color: 'var(--text-dim)' }}> {inputTokens} in, {outputTokens} out </div> </div> <div className="metric-card success"> <div className="metric-label">Estimated Cost</div> <div className="metric-value success">{estimatedCost}</div> <div className="text-xs mt-1" style={{ color: 'var(--text-dim)' }}> {currentResult.endpoint?.defaultModel || 'Unknown model'} </div> </div> </div>); })()} {currentResult.inputData && Object.keys(currentResult.inputData).length > 0 && (<div className="card"> <h3 className="text-sm font-medium mb-3" style={{ color: 'var(--text-primary)' }}> Input Variables </h3> <div className="space-y-2"> {Object.entries(currentResult.inputData).map(([key, value]) => (<div key={key} className="flex gap-3"> <span className="variable-badge">{`{{${key}}}`}</span> <span className="text-sm flex-1" style={{ color: 'var(--text-secondary)' }}> {value} </span> </div>))} </div> </div>)} <div className="flex gap-3"> <button onClick={handleRunPrompt} disabled={isLoading} className="btn btn-secondary flex-1"> 🔄 Regenerate </button> <button className="btn btn-success flex-1"> ✓ Save </button> </div> </>)}
-            {!currentResult && !isLoading && !error && (<div className="text-center py-12"> <div className="text-4xl mb-4">🚀</div> <h3 className="text-lg font-medium mb-2" style={{ color: 'var(--text-primary)' }}> Ready to test your prompt </h3> <p style={{ color: 'var(--text-muted)' }}> Click "Run Prompt" to see the AI response </p> </div>)}
+            {error && (<div className="p-4 rounded-lg border" style={styles.errorBox}> <div className="flex items-center gap-2 mb-2"> <svg className="w-4 h-4" fill="currentColor" viewBox="0 0 20 20"> <path fillRule="evenodd" d="M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7 4a1 1 0 11-2 0 1 1 0 012 0zm-1-9a1 1 0 00-1 1v4a1 1 0 102 0V6a1 1 0 00-1-1z" clipRule="evenodd" /> </svg> <span className="font-medium text-sm">Error</span> </div> <p className="text-sm">{error}</p> </div>)}
+            {currentResult && (<> <div className="card"> <div className="flex items-start gap-3 mb-4"> <div className="w-7 h-7 rounded-full flex items-center justify-center text-xs" style={styles.avatar}> 🤖 </div> <div className="flex-1 min-w-0"> <div className="flex items-center justify-between mb-1"> <div className="font-medium text-sm" style={styles.primaryText}> {currentResult.endpoint?.name || 'AI'} Response </div> <div className="text-xs" style={styles.mutedText}> {formatResultTimestamp(currentResult)} </div> </div> {currentResult.endpoint?.defaultModel && (<div className="text-xs" style={styles.mutedText}> {currentResult.endpoint.defaultModel} </div>)} </div> </div> <div className="prose prose-sm max-w-none"> <div style={styles.responseBody}> {currentResult.output?.choices?.[0]?.message?.content ? (<div className="whitespace-pre-wrap"> {currentResult.output.choices[0].message.content} </div>) : currentResult.output?.content ? (<div className="whitespace-pre-wrap"> {currentResult.output.content} </div>) : (<div style={styles.mutedText}> No response content available </div>)} </div> </div> </div> {currentResultUsage && (<div className="grid grid-cols-2 gap-4"> <div className="metric-card primary"> <div className="metric-label">Tokens Used</div> <div className="metric-value primary">{currentResultUsage.totalTokens.toLocaleString()}</div> <div className="text-xs mt-1" style={styles.dimText}> {currentResultUsage.inputTokens} in, {currentResultUsage.outputTokens} out </div> </div> <div className="metric-card success"> <div className="metric-label">Estimated Cost</div> <div className="metric-value success">{currentResultUsage.estimatedCost}</div> <div className="text-xs mt-1" style={styles.dimText}> {currentResult.endpoint?.defaultModel || 'Unknown model'} </div> </div> </div>)} {currentResult.inputData && Object.keys(currentResult.inputData).length > 0 && (<div className="card"> <h3 className="text-sm font-medium mb-3" style={styles.primaryText}> Input Variables </h3> <div className="space-y-2"> {Object.entries(currentResult.inputData).map(([key, value]) => (<div key={key} className="flex gap-3"> <span className="variable-badge">{`{{${key}}}`}</span> <span className="text-sm flex-1" style={styles.secondaryText}> {value} </span> </div>))} </div> </div>)} <div className="flex gap-3"> <button onClick={handleRunPrompt} disabled={isLoading} className="btn btn-secondary flex-1"> 🔄 Regenerate </button> <button className="btn btn-success flex-1"> ✓ Save </button> </div> </>)}
+            {!currentResult && !isLoading && !error && (<div className="text-center py-12"> <div className="text-4xl mb-4">🚀</div> <h3 className="text-lg font-medium mb-2" style={styles.primaryText}> Ready to test your prompt </h3> <p style={styles.mutedText}> Click "Run Prompt" to see the AI response </p> </div>)}
           </div>
         )}
 
@@ -341,61 +450,31 @@ const ResultViewer = ({ taskId, versionId }) => {
               {versionResults.length === 0 ? (
                 <div className="text-center py-12">
                   <div className="text-4xl mb-4">📚</div>
-                  <p style={{ color: 'var(--text-muted)' }}>No execution history</p>
+                  <p style={styles.mutedText}>No execution history</p>
                 </div>
               ) : (
-                versionResults.map((result, index) => (
-                  <div key={result.timestamp} 
-                       className={`card cursor-pointer hover:bg-opacity-80 transition-all relative group ${selectedHistoryItem?.timestamp === result.timestamp ? 'ring-2 ring-purple-500' : ''}`}
-                       onClick={() => setSelectedHistoryItem(result)}>
-                    <button 
-                      onClick={(e) => handleDeleteHistory(e, result.timestamp)}
-                      className="absolute top-2 right-2 p-1 rounded-full hover:bg-red-500 hover:text-white opacity-0 group-hover:opacity-100 transition-opacity"
-                      title="Delete history item"
-                      style={{ background: 'var(--bg-tertiary)'}}
-                    >
-                      <svg xmlns="http://www.w3.org/2000/svg" className="h-4 w-4" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                        <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M6 18L18 6M6 6l12 12" />
-                      </svg>
-                    </button>
-                    <div className="flex items-start gap-3">
-                      <div className="w-6 h-6 rounded-full flex items-center justify-center text-xs"
-                           style={{ background: 'var(--bg-tertiary)' }}>
-                        {versionResults.length - index}
-                      </div>
-                      <div className="flex-1 min-w-0">
-                        <div className="flex items-center justify-between mb-2">
-                          <div className="text-sm font-medium" style={{ color: 'var(--text-primary)' }}>
-                            Run #{versionResults.length - index}
-                          </div>
-                          <div className="text-xs" style={{ color: 'var(--text-muted)' }}>
-                            {new Date(result.timestamp).toLocaleString()}
-                          </div>
-                        </div>
-                        <div className="text-sm line-clamp-2 mb-2" style={{ color: 'var(--text-secondary)' }}>
-                          {result.output?.choices?.[0]?.message?.content?.substring(0, 120) || 
-                           result.output?.content?.substring(0, 120) || 
-                           'No response content'}...
-                        </div>
-                        <div className="flex gap-4 text-xs items-center" style={{ color: 'var(--text-dim)' }}>
-                          <span>
-                            {calculateTokens(JSON.stringify(result.inputData) + 
-                                           (result.output?.choices?.[0]?.message?.content || result.output?.content || ''))} tokens
-                          </span>
-                          {(result.endpoint?.defaultModel || result.endpoint?.name) && (
-                            <span className="font-mono p-1 rounded text-xs" style={{background: 'var(--bg-tertiary)'}}>
-                              {result.endpoint?.defaultModel || result.endpoint?.name}
-                            </span>
-                          )}
-                        </div>
-                      </div>
-                    </div>
-                  </div>
+                versionResults.slice(0, visibleHistoryCount).map((result, index) => (
+                  <HistoryItem
+                    key={result.timestamp}
+                    result={result}
+                    runNumber={versionResults.length - index}
+                    isSelected={selectedHistoryItem?.timestamp === result.timestamp}
+                    onSelect={setSelectedHistoryItem}
+                    onDelete={handleDeleteHistory}
+                  />
                 ))
               )}
+              {versionResults.length > visibleHistoryCount && (
+                <button
+                  className="btn btn-secondary w-full"
+                  onClick={() => setVisibleHistoryCount(count => count + HISTORY_PAGE_SIZE)}
+                >
+                  Show more ({versionResults.length - visibleHistoryCount} remaining)
+                </button>
+              )}
             </div>
             <div className="flex-1 overflow-y-auto">
-              <HistoryDetailView result={selectedHistoryItem} version={currentVersion} />
+              <HistoryDetailView result={selectedHistoryItem} version={currentVersion} renderPrompt={renderPrompt} />
             </div>
           </div>
         )}
@@ -1,5 +1,14 @@
 import React from 'react';
 
+// 렌더링마다 새 스타일 객체를 만들지 않도록 모듈 레벨에 한 번만 정의
+const styles = {
+  sectionBorder: { borderColor: 'var(--border-primary)' },
+  footer: { borderColor: 'var(--border-primary)', background: 'var(--bg-primary)' },
+  statusBorder: { borderColor: 'var(--border-secondary)' },
+  mutedText: { color: 'var(--text-muted)' },
+  dimText: { color: 'var(--text-dim)' }
+};
+
 function LLMEndpointList({
   endpoints,
   selectedEndpointId,
@@ -16,13 +25,13 @@ function LLMEndpointList({
     <div className="h-full flex flex-col">
       {/* Active Endpoint Summary */}
       {activeEndpoint && (
-        <div className="p-3 border-b" style={{ borderColor: 'var(--border-primary)' }}>
-          <div className="text-xs mb-2 uppercase tracking-wide font-medium" style={{ color: 'var(--text-muted)' }}>
+        <div className="p-3 border-b" style={styles.sectionBorder}>
+          <div className="text-xs mb-2 uppercase tracking-wide font-medium" style={styles.mutedText}>
             Active Provider
           </div>
-          <div className="flex items-center gap-2 p-2 rounded text-sm" style={{ background: 'rgba(16, 185, 129, 0.1)', border: '1px solid var(--accent-success)'}}>
+          <div className="status-active flex items-center gap-2 p-2 rounded text-sm">
             <div className="w-2 h-2 rounded-full bg-green-500 flex-shrink-0"></div>
-            <div className="font-medium truncate" style={{ color: 'var(--accent-success)' }}>
+            <div className="font-medium truncate">
               {activeEndpoint.name}
             </div>
           </div>
@@ -34,10 +43,10 @@ function LLMEndpointList({
         {endpoints.length === 0 ? (
           <div className="flex flex-col items-center justify-center h-32 text-center px-4">
             <div className="text-2xl mb-2 opacity-30">⚙️</div>
-            <p className="text-xs" style={{ color: 'var(--text-muted)' }}>
+            <p className="text-xs" style={styles.mutedText}>
               No providers configured
             </p>
-            <p className="text-xs mt-1" style={{ color: 'var(--text-dim)' }}>
+            <p className="text-xs mt-1" style={styles.dimText}>
               Add your first LLM endpoint below
             </p>
           </div>
@@ -113,18 +122,11 @@ function LLMEndpointList({
       </div>
       
       {/* Footer Actions - Julius Style */}
-      <div className="border-t p-3" style={{ borderColor: 'var(--border-primary)', background: 'var(--bg-primary)' }}>
+      <div className="border-t p-3" style={styles.footer}>
         <div className="space-y-2">
           <button
             onClick={onCreateNew}
-            className="w-full flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium rounded transition-all duration-200"
-            style={{ 
-              background: 'var(--accent-primary)', 
-              color: 'white',
-              border: 'none'
-            }}
-            onMouseEnter={(e) => e.target.style.background = 'var(--accent-secondary)'}
-            onMouseLeave={(e) => e.target.style.background = 'var(--accent-primary)'}
+            className="btn-primary w-full flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium rounded border-0 transition-all duration-200"
           >
             <svg className="w-3 h-3" fill="none" stroke="currentColor" viewBox="0 0 24 24">
               <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 6v6m0 0v6m0-6h6m-6 0H6" />
@@ -135,22 +137,7 @@ function LLMEndpointList({
           <button
             onClick={() => selectedEndpointId && onDelete(selectedEndpointId)}
             disabled={!selectedEndpointId}
-            className="w-full flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium rounded transition-all duration-200 disabled:opacity-50 disabled:cursor-not-allowed"
-            style={{ 
-              background: selectedEndpointId ? 'var(--accent-danger)' : 'var(--bg-tertiary)', 
-              color: selectedEndpointId ? 'white' : 'var(--text-muted)',
-              border: 'none'
-            }}
-            onMouseEnter={(e) => {
-              if (!e.target.disabled) {
-                e.target.style.background = '#dc2626';
-              }
-            }}
-            onMouseLeave={(e) => {
-              if (!e.target.disabled) {
-                e.target.style.background = 'var(--accent-danger)';
-              }
-            }}
+            className="btn-danger w-full flex items-center justify-center gap-2 px-3 py-2 text-xs font-medium rounded border-0 transition-all duration-200 disabled:opacity-50 disabled:cursor-not-allowed"
           >
             <svg className="w-3 h-3" fill="none" stroke="currentColor" viewBox="0 0 24 24">
               <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16" />
@@ -160,13 +147,13 @@ function LLMEndpointList({
         </div>
         
         {/* Status indicators */}
-        <div className="mt-3 pt-3 border-t flex items-center justify-between text-xs" style={{ borderColor: 'var(--border-secondary)' }}>
+        <div className="mt-3 pt-3 border-t flex items-center justify-between text-xs" style={styles.statusBorder}>
           <div className="flex items-center gap-2">
             <div className="w-1.5 h-1.5 rounded-full bg-green-500"></div>
-            <span style={{ color: 'var(--text-dim)' }}>{endpoints.length} provider{endpoints.length !== 1 ? 's' : ''}</span>
+            <span style={styles.dimText}>{endpoints.length} provider{endpoints.length !== 1 ? 's' : ''}</span>
           </div>
           {selectedEndpointId && (
-            <span style={{ color: 'var(--text-dim)' }}>Selected</span>
+            <span style={styles.dimText}>Selected</span>
           )}
         </div>
       </div>
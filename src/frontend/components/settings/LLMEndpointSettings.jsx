@@ -3,9 +3,43 @@ import { useStore } from '../../store.jsx';
 import LLMEndpointList from './LLMEndpointList.jsx';
 import LLMEndpointForm from './LLMEndpointForm.jsx';
 
+// 스타일 객체들을 상수로 분리 (렌더링마다 새로 만들지 않도록)
+const styles = {
+  page: { background: 'var(--bg-primary)' },
+  sidebar: { background: 'var(--bg-secondary)', borderColor: 'var(--border-primary)' },
+  sidebarHeader: { borderColor: 'var(--border-primary)', background: 'var(--bg-primary)' },
+  accentIconBox: { background: 'var(--accent-primary)' },
+  primaryText: { color: 'var(--text-primary)' },
+  mutedText: { color: 'var(--text-muted)' },
+  detailHeader: { borderColor: 'var(--border-primary)', background: 'var(--bg-secondary)' },
+  iconBox: { background: 'var(--bg-tertiary)' },
+  accentText: { color: 'var(--accent-primary)' },
+  activeBadge: { background: 'rgba(16, 185, 129, 0.2)', color: 'var(--accent-success)' },
+  defaultBadge: { background: 'rgba(139, 92, 246, 0.2)', color: 'var(--accent-primary)' },
+  editButton: { background: 'var(--bg-tertiary)', color: 'var(--text-primary)', border: '1px solid var(--border-primary)', minWidth: '90px' },
+  activateButton: { background: 'var(--accent-success)', color: 'white', border: 'none', minWidth: '100px' },
+  setDefaultButton: { background: 'var(--accent-primary)', color: 'white', border: 'none', minWidth: '120px' },
+  infoCard: { background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' },
+  urlBox: { background: 'var(--bg-primary)', border: '1px solid var(--border-primary)', color: 'var(--accent-primary)' },
+  secondaryAccentText: { color: 'var(--accent-secondary)' },
+  valueBox: { background: 'var(--bg-primary)', border: '1px solid var(--border-primary)' },
+  valueText: { background: 'var(--bg-primary)', border: '1px solid var(--border-primary)', color: 'var(--text-primary)' },
+  valueTextMuted: { background: 'var(--bg-primary)', border: '1px solid var(--border-primary)', color: 'var(--text-muted)' },
+  successText: { color: 'var(--accent-success)' },
+  warningText: { color: 'var(--accent-warning)' },
+  primaryButton: { background: 'var(--accent-primary)', color: 'white', border: 'none' },
+  successButton: { background: 'var(--accent-success)', color: 'white', border: 'none' },
+  secondaryText: { color: 'var(--text-secondary)' },
+  testMessageInput: { background: 'var(--bg-tertiary)', border: '1px solid var(--border-primary)', color: 'var(--text-primary)', minHeight: '60px' },
+  errorBox: { background: 'rgba(239, 68, 68, 0.1)', borderColor: 'var(--accent-danger)', color: 'var(--accent-danger)' },
+  resultBox: { background: 'var(--bg-tertiary)', borderColor: 'var(--border-primary)' }
+};
+
 function LLMEndpointSettings() {
   const {
     llmEndpoints,
+    llmEndpointsById,
+    activeLlmEndpoint,
     activeLlmEndpointId,
     defaultLlmEndpointId,
     loadLlmEndpoints,
@@ -39,12 +73,10 @@ function LLMEndpointSettings() {
   
   // 선택된 엔드포인트 정보 가져오기
   const selectedEndpoint = selectedEndpointId 
-    ? llmEndpoints.find(ep => ep.id === selectedEndpointId) 
+    ? llmEndpointsById.get(selectedEndpointId) || null
     : null;
   
-  const activeEndpoint = activeLlmEndpointId 
-    ? llmEndpoints.find(ep => ep.id === activeLlmEndpointId) 
-    : null;
+  const activeEndpoint = activeLlmEndpoint;
   
   // 엔드포인트 선택
   const handleSelectEndpoint = (endpointId) => {
@@ -69,7 +101,7 @@ function LLMEndpointSettings() {
   
   // 엔드포인트 삭제
   const handleDelete = async (endpointId) => {
-    const endpoint = llmEndpoints.find(ep => ep.id === endpointId);
+    const endpoint = llmEndpointsById.get(endpointId);
     if (!endpoint) return;
     
     if (window.confirm(`Are you sure you want to delete '${endpoint.name}' provider?\n\nThis action cannot be undone.`)) {
@@ -213,23 +245,23 @@ function LLMEndpointSettings() {
   };
   
   return (
-    <div className="h-full flex" style={{ background: 'var(--bg-primary)' }}>
+    <div className="h-full flex" style={styles.page}>
       {/* Left Panel - Endpoint List */}
-      <div className="flex-shrink-0 w-80 border-r" style={{ background: 'var(--bg-secondary)', borderColor: 'var(--border-primary)' }}>
+      <div className="flex-shrink-0 w-80 border-r" style={styles.sidebar}>
         <div className="h-full flex flex-col">
           {/* Panel Header */}
-          <div className="flex-shrink-0 p-4 border-b" style={{ borderColor: 'var(--border-primary)', background: 'var(--bg-primary)' }}>
+          <div className="flex-shrink-0 p-4 border-b" style={styles.sidebarHeader}>
             <div className="flex items-center gap-3">
-              <div className="p-2 rounded-lg" style={{ background: 'var(--accent-primary)' }}>
+              <div className="p-2 rounded-lg" style={styles.accentIconBox}>
                 <svg className="w-4 h-4 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                   <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12l2 2 4-4M7.835 4.697a3.42 3.42 0 001.946-.806 3.42 3.42 0 014.438 0 3.42 3.42 0 001.946.806 3.42 3.42 0 013.138 3.138 3.42 3.42 0 00.806 1.946 3.42 3.42 0 010 4.438 3.42 3.42 0 00-.806 1.946 3.42 3.42 0 01-3.138 3.138 3.42 3.42 0 00-1.946.806 3.42 3.42 0 01-4.438 0 3.42 3.42 0 00-1.946-.806 3.42 3.42 0 01-3.138-3.138 3.42 3.42 0 00-.806-1.946 3.42 3.42 0 010-4.438 3.42 3.42 0 00.806-1.946 3.42 3.42 0 013.138-3.138z" />
                 </svg>
               </div>
               <div>
-                <h2 className="text-sm font-semibold" style={{ color: 'var(--text-primary)' }}>
+                <h2 className="text-sm font-semibold" style={styles.primaryText}>
                   LLM Providers
                 </h2>
-                <p className="text-xs" style={{ color: 'var(--text-muted)' }}>
+                <p className="text-xs" style={styles.mutedText}>
                   Manage API endpoints
                 </p>
               </div>
@@ -265,32 +297,32 @@ function LLMEndpointSettings() {
         ) : selectedEndpoint ? (
           <div className="h-full flex flex-col">
             {/* Header */}
-            <div className="flex-shrink-0 p-6 border-b" style={{ borderColor: 'var(--border-primary)', background: 'var(--bg-secondary)' }}>
+            <div className="flex-shrink-0 p-6 border-b" style={styles.detailHeader}>
               <div className="flex items-center justify-between">
                 <div className="flex items-center gap-4">
-                  <div className="p-3 rounded-xl" style={{ background: 'var(--bg-tertiary)' }}>
-                    <svg className="w-6 h-6" style={{ color: 'var(--accent-primary)' }} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                  <div className="p-3 rounded-xl" style={styles.iconBox}>
+                    <svg className="w-6 h-6" style={styles.accentText} fill="none" stroke="currentColor" viewBox="0 0 24 24">
                       <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12l2 2 4-4M7.835 4.697a3.42 3.42 0 001.946-.806 3.42 3.42 0 014.438 0 3.42 3.42 0 001.946.806 3.42 3.42 0 013.138 3.138 3.42 3.42 0 00.806 1.946 3.42 3.42 0 010 4.438 3.42 3.42 0 00-.806 1.946 3.42 3.42 0 01-3.138 3.138 3.42 3.42 0 00-1.946.806 3.42 3.42 0 01-4.438 0 3.42 3.42 0 00-1.946-.806 3.42 3.42 0 01-3.138-3.138 3.42 3.42 0 00-.806-1.946 3.42 3.42 0 010-4.438 3.42 3.42 0 00.806-1.946 3.42 3.42 0 013.138-3.138z" />
                     </svg>
                   </div>
                   <div>
-                    <h1 className="text-xl font-semibold flex items-center gap-3" style={{ color: 'var(--text-primary)' }}>
+                    <h1 className="text-xl font-semibold flex items-center gap-3" style={styles.primaryText}>
                       {selectedEndpoint.name}
                       {activeLlmEndpointId === selectedEndpointId && (
-                        <span className="inline-flex items-center gap-1 px-2 py-1 text-xs rounded-full" style={{ background: 'rgba(16, 185, 129, 0.2)', color: 'var(--accent-success)' }}>
+                        <span className="inline-flex items-center gap-1 px-2 py-1 text-xs rounded-full" style={styles.activeBadge}>
                           <div className="w-1.5 h-1.5 rounded-full bg-green-500"></div>
                           Active
                         </span>
                       )}
                       {defaultLlmEndpointId === selectedEndpointId && (
-                        <span className="inline-flex items-center gap-1 px-2 py-1 text-xs rounded-full" style={{ background: 'rgba(139, 92, 246, 0.2)', color: 'var(--accent-primary)' }}>
+                        <span className="inline-flex items-center gap-1 px-2 py-1 text-xs rounded-full" style={styles.defaultBadge}>
                           <div className="w-1.5 h-1.5 rounded-full bg-purple-500"></div>
                           Default
                         </span>
                       )}
                     </h1>
                     {selectedEndpoint.description && (
-                      <p className="text-sm mt-1" style={{ color: 'var(--text-muted)' }}>
+                      <p className="text-sm mt-1" style={styles.mutedText}>
                         {selectedEndpoint.description}
                       </p>
                     )}
@@ -301,7 +333,7 @@ function LLMEndpointSettings() {
                   <button
                     onClick={() => handleEdit(selectedEndpointId)}
                     className="flex items-center gap-2 px-4 py-2 text-sm rounded-lg transition-all duration-200 hover:bg-gray-700"
-                    style={{ background: 'var(--bg-tertiary)', color: 'var(--text-primary)', border: '1px solid var(--border-primary)', minWidth: '90px' }}
+                    style={styles.editButton}
                   >
                     <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                       <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M11 5H6a2 2 0 00-2 2v11a2 2 0 002 2h11a2 2 0 002-2v-5m-1.414-9.414a2 2 0 112.828 2.828L11.828 15H9v-2.828l8.586-8.586z" />
@@ -313,7 +345,7 @@ function LLMEndpointSettings() {
                     <button
                       onClick={() => handleActivate(selectedEndpointId)}
                       className="flex items-center gap-2 px-4 py-2 text-sm rounded-lg transition-all duration-200 hover:shadow-md"
-                      style={{ background: 'var(--accent-success)', color: 'white', border: 'none', minWidth: '100px' }}
+                      style={styles.activateButton}
                     >
                       <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                         <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M13 10V3L4 14h7v7l9-11h-7z" />
@@ -326,7 +358,7 @@ function LLMEndpointSettings() {
                     <button
                       onClick={() => handleSetDefault(selectedEndpointId)}
                       className="flex items-center gap-2 px-4 py-2 text-sm rounded-lg transition-all duration-200 hover:shadow-md"
-                      style={{ background: 'var(--accent-primary)', color: 'white', border: 'none', minWidth: '120px' }}
+                      style={styles.setDefaultButton}
                     >
                       <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                         <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M5 3v4M3 5h4M6 17v4m-2-2h4m5-16l2.286 6.857L21 12l-5.714 2.143L13 21l-2.286-6.857L5 12l5.714-2.143L13 3z" />
@@ -343,17 +375,17 @@ function LLMEndpointSettings() {
               <div className="max-w-4xl">
                 <div className="grid grid-cols-1 md:grid-cols-2 gap-6 mb-8">
                   {/* Base URL Card */}
-                  <div className="p-4 rounded-lg border" style={{ background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' }}>
+                  <div className="p-4 rounded-lg border" style={styles.infoCard}>
                     <div className="flex items-start gap-3">
-                      <div className="p-2 rounded-lg" style={{ background: 'var(--bg-tertiary)' }}>
-                        <svg className="w-4 h-4" style={{ color: 'var(--accent-primary)' }} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                      <div className="p-2 rounded-lg" style={styles.iconBox}>
+                        <svg className="w-4 h-4" style={styles.accentText} fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M13.828 10.172a4 4 0 00-5.656 0l-4 4a4 4 0 105.656 5.656l1.102-1.101m-.758-4.899a4 4 0 005.656 0l4-4a4 4 0 00-5.656-5.656l-1.1 1.1" />
                         </svg>
                       </div>
                       <div className="min-w-0 flex-1">
-                        <h3 className="text-sm font-medium mb-1" style={{ color: 'var(--text-primary)' }}>API Endpoint</h3>
-                        <p className="text-xs mb-2" style={{ color: 'var(--text-muted)' }}>Base URL for API requests</p>
-                        <div className="p-3 rounded-lg font-mono text-sm break-all" style={{ background: 'var(--bg-primary)', border: '1px solid var(--border-primary)', color: 'var(--accent-primary)' }}>
+                        <h3 className="text-sm font-medium mb-1" style={styles.primaryText}>API Endpoint</h3>
+                        <p className="text-xs mb-2" style={styles.mutedText}>Base URL for API requests</p>
+                        <div className="p-3 rounded-lg font-mono text-sm break-all" style={styles.urlBox}>
                           {selectedEndpoint.baseUrl}
                         </div>
                       </div>
@@ -361,17 +393,17 @@ function LLMEndpointSettings() {
                   </div>
                   
                   {/* Model Card */}
-                  <div className="p-4 rounded-lg border" style={{ background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' }}>
+                  <div className="p-4 rounded-lg border" style={styles.infoCard}>
                     <div className="flex items-start gap-3">
-                      <div className="p-2 rounded-lg" style={{ background: 'var(--bg-tertiary)' }}>
-                        <svg className="w-4 h-4" style={{ color: 'var(--accent-secondary)' }} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                      <div className="p-2 rounded-lg" style={styles.iconBox}>
+                        <svg className="w-4 h-4" style={styles.secondaryAccentText} fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9.663 17h4.673M12 3v1m6.364 1.636l-.707.707M21 12h-1M4 12H3m3.343-5.657l-.707-.707m2.828 9.9a5 5 0 117.072 0l-.548.547A3.374 3.374 0 0014 18.469V19a2 2 0 11-4 0v-.531c0-.895-.356-1.754-.988-2.386l-.548-.547z" />
                         </svg>
                       </div>
                       <div className="min-w-0 flex-1">
-                        <h3 className="text-sm font-medium mb-1" style={{ color: 'var(--text-primary)' }}>Default Model</h3>
-                        <p className="text-xs mb-2" style={{ color: 'var(--text-muted)' }}>Model used by default</p>
-                        <div className="p-3 rounded-lg font-mono text-sm" style={{ background: 'var(--bg-primary)', border: '1px solid var(--border-primary)', color: selectedEndpoint.defaultModel ? 'var(--text-primary)' : 'var(--text-muted)' }}>
+                        <h3 className="text-sm font-medium mb-1" style={styles.primaryText}>Default Model</h3>
+                        <p className="text-xs mb-2" style={styles.mutedText}>Model used by default</p>
+                        <div className="p-3 rounded-lg font-mono text-sm" style={selectedEndpoint.defaultModel ? styles.valueText : styles.valueTextMuted}>
                           {selectedEndpoint.defaultModel || 'Not specified'}
                         </div>
                       </div>
@@ -379,26 +411,26 @@ function LLMEndpointSettings() {
                   </div>
                   
                   {/* Authentication Card */}
-                  <div className="p-4 rounded-lg border" style={{ background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' }}>
+                  <div className="p-4 rounded-lg border" style={styles.infoCard}>
                     <div className="flex items-start gap-3">
-                      <div className="p-2 rounded-lg" style={{ background: 'var(--bg-tertiary)' }}>
-                        <svg className="w-4 h-4" style={{ color: selectedEndpoint.apiKey ? 'var(--accent-success)' : 'var(--text-muted)' }} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                      <div className="p-2 rounded-lg" style={styles.iconBox}>
+                        <svg className="w-4 h-4" style={selectedEndpoint.apiKey ? styles.successText : styles.mutedText} fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M15 7a2 2 0 012 2m4 0a6 6 0 01-7.743 5.743L11 17H9v2H7v2H4a1 1 0 01-1-1v-2.586a1 1 0 01.293-.707l5.964-5.964A6 6 0 1121 9z" />
                         </svg>
                       </div>
                       <div className="min-w-0 flex-1">
-                        <h3 className="text-sm font-medium mb-1" style={{ color: 'var(--text-primary)' }}>Authentication</h3>
-                        <p className="text-xs mb-2" style={{ color: 'var(--text-muted)' }}>API key configuration</p>
-                        <div className="p-3 rounded-lg font-mono text-sm flex items-center gap-2" style={{ background: 'var(--bg-primary)', border: '1px solid var(--border-primary)' }}>
+                        <h3 className="text-sm font-medium mb-1" style={styles.primaryText}>Authentication</h3>
+                        <p className="text-xs mb-2" style={styles.mutedText}>API key configuration</p>
+                        <div className="p-3 rounded-lg font-mono text-sm flex items-center gap-2" style={styles.valueBox}>
                           {selectedEndpoint.apiKey ? (
                             <>
                               <div className="w-2 h-2 rounded-full bg-green-500"></div>
-                              <span style={{ color: 'var(--accent-success)' }}>API Key configured</span>
+                              <span style={styles.successText}>API Key configured</span>
                             </>
                           ) : (
                             <>
                               <div className="w-2 h-2 rounded-full bg-gray-500"></div>
-                              <span style={{ color: 'var(--text-muted)' }}>No authentication</span>
+                              <span style={styles.mutedText}>No authentication</span>
                             </>
                           )}
                         </div>
@@ -407,17 +439,17 @@ function LLMEndpointSettings() {
                   </div>
                   
                   {/* Context Size Card */}
-                  <div className="p-4 rounded-lg border" style={{ background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' }}>
+                  <div className="p-4 rounded-lg border" style={styles.infoCard}>
                     <div className="flex items-start gap-3">
-                      <div className="p-2 rounded-lg" style={{ background: 'var(--bg-tertiary)' }}>
-                        <svg className="w-4 h-4" style={{ color: 'var(--accent-warning)' }} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                      <div className="p-2 rounded-lg" style={styles.iconBox}>
+                        <svg className="w-4 h-4" style={styles.warningText} fill="none" stroke="currentColor" viewBox="0 0 24 24">
                           <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M7 12l3-3 3 3 4-4M8 21l4-4 4 4M3 4h18M4 4h16v12a1 1 0 01-1 1H5a1 1 0 01-1-1V4z" />
                         </svg>
                       </div>
                       <div className="min-w-0 flex-1">
-                        <h3 className="text-sm font-medium mb-1" style={{ color: 'var(--text-primary)' }}>Context Window</h3>
-                        <p className="text-xs mb-2" style={{ color: 'var(--text-muted)' }}>Maximum token capacity</p>
-                        <div className="p-3 rounded-lg font-mono text-sm" style={{ background: 'var(--bg-primary)', border: '1px solid var(--border-primary)', color: selectedEndpoint.contextSize ? 'var(--text-primary)' : 'var(--text-muted)' }}>
+                        <h3 className="text-sm font-medium mb-1" style={styles.primaryText}>Context Window</h3>
+                        <p className="text-xs mb-2" style={styles.mutedText}>Maximum token capacity</p>
+                        <div className="p-3 rounded-lg font-mono text-sm" style={selectedEndpoint.contextSize ? styles.valueText : styles.valueTextMuted}>
                           {selectedEndpoint.contextSize ? `${selectedEndpoint.contextSize.toLocaleString()} tokens` : 'Not specified'}
                         </div>
                       </div>
@@ -426,8 +458,8 @@ function LLMEndpointSettings() {
                 </div>
                 
                 {/* Test Section */}
-                <div className="p-4 rounded-lg border mb-8" style={{ background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' }}>
-                  <h3 className="text-sm font-medium mb-4 flex items-center gap-2" style={{ color: 'var(--text-primary)' }}>
+                <div className="p-4 rounded-lg border mb-8" style={styles.infoCard}>
+                  <h3 className="text-sm font-medium mb-4 flex items-center gap-2" style={styles.primaryText}>
                     <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                       <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z" />
                     </svg>
@@ -444,7 +476,7 @@ function LLMEndpointSettings() {
                         className={`w-full flex items-center justify-center gap-2 px-4 py-3 rounded-lg text-sm font-medium transition-all duration-200 ${
                           testState.isTestingModels ? 'opacity-50 cursor-not-allowed' : 'hover:shadow-md'
                         }`}
-                        style={{ background: 'var(--accent-primary)', color: 'white', border: 'none' }}
+                        style={styles.primaryButton}
                       >
                         {testState.isTestingModels ? (
                           <>
@@ -463,7 +495,7 @@ function LLMEndpointSettings() {
                           </>
                         )}
                       </button>
-                      <p className="text-xs" style={{ color: 'var(--text-muted)' }}>Check available models</p>
+                      <p className="text-xs" style={styles.mutedText}>Check available models</p>
                     </div>
                     
                     {/* Chat Test */}
@@ -474,7 +506,7 @@ function LLMEndpointSettings() {
                         className={`w-full flex items-center justify-center gap-2 px-4 py-3 rounded-lg text-sm font-medium transition-all duration-200 ${
                           testState.isTestingChat ? 'opacity-50 cursor-not-allowed' : 'hover:shadow-md'
                         }`}
-                        style={{ background: 'var(--accent-success)', color: 'white', border: 'none' }}
+                        style={styles.successButton}
                       >
                         {testState.isTestingChat ? (
                           <>
@@ -493,23 +525,18 @@ function LLMEndpointSettings() {
                           </>
                         )}
                       </button>
-                      <p className="text-xs" style={{ color: 'var(--text-muted)' }}>Test chat completion</p>
+                      <p className="text-xs" style={styles.mutedText}>Test chat completion</p>
                     </div>
                   </div>
                   
                   {/* Test Message Input */}
                   <div className="mb-4">
-                    <label className="block text-xs font-medium mb-2" style={{ color: 'var(--text-secondary)' }}>Test Message:</label>
+                    <label className="block text-xs font-medium mb-2" style={styles.secondaryText}>Test Message:</label>
                     <textarea
                       value={testState.testMessage}
                       onChange={(e) => updateTestMessage(e.target.value)}
                       className="w-full px-3 py-2 rounded text-sm transition-all duration-200 focus:border-purple-500 resize-none"
-                      style={{ 
-                        background: 'var(--bg-tertiary)', 
-                        border: '1px solid var(--border-primary)',
-                        color: 'var(--text-primary)',
-                        minHeight: '60px'
-                      }}
+                      style={styles.testMessageInput}
                       placeholder="Enter your test message here..."
                       rows={2}
                     />
@@ -520,11 +547,7 @@ function LLMEndpointSettings() {
                     <div className="space-y-4">
                       {/* Error Display */}
                       {testState.testError && (
-                        <div className="p-3 rounded-lg border" style={{ 
-                          background: 'rgba(239, 68, 68, 0.1)', 
-                          borderColor: 'var(--accent-danger)',
-                          color: 'var(--accent-danger)'
-                        }}>
+                        <div className="p-3 rounded-lg border" style={styles.errorBox}>
                           <div className="flex items-center gap-2 mb-2">
                             <svg className="w-4 h-4" fill="currentColor" viewBox="0 0 20 20">
                               <path fillRule="evenodd" d="M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7 4a1 1 0 11-2 0 1 1 0 012 0zm-1-9a1 1 0 00-1 1v4a1 1 0 102 0V6a1 1 0 00-1-1z" clipRule="evenodd" />
@@ -537,8 +560,8 @@ function LLMEndpointSettings() {
                       
                       {/* Models Result */}
                       {testState.modelsResult && (
-                        <div className="p-3 rounded-lg border" style={{ background: 'var(--bg-tertiary)', borderColor: 'var(--border-primary)' }}>
-                          <h4 className="font-medium text-sm mb-2 flex items-center gap-2" style={{ color: 'var(--text-primary)' }}>
+                        <div className="p-3 rounded-lg border" style={styles.resultBox}>
+                          <h4 className="font-medium text-sm mb-2 flex items-center gap-2" style={styles.primaryText}>
                             <svg className="w-4 h-4 text-green-500" fill="currentColor" viewBox="0 0 20 20">
                               <path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd" />
                             </svg>
@@ -554,8 +577,8 @@ function LLMEndpointSettings() {
                       
                       {/* Chat Result */}
                       {testState.chatResult && (
-                        <div className="p-3 rounded-lg border" style={{ background: 'var(--bg-tertiary)', borderColor: 'var(--border-primary)' }}>
-                          <h4 className="font-medium text-sm mb-2 flex items-center gap-2" style={{ color: 'var(--text-primary)' }}>
+                        <div className="p-3 rounded-lg border" style={styles.resultBox}>
+                          <h4 className="font-medium text-sm mb-2 flex items-center gap-2" style={styles.primaryText}>
                             <svg className="w-4 h-4 text-green-500" fill="currentColor" viewBox="0 0 20 20">
                               <path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd" />
                             </svg>
@@ -573,19 +596,19 @@ function LLMEndpointSettings() {
                 </div>
                 
                 {/* Metadata */}
-                <div className="p-4 rounded-lg border" style={{ background: 'var(--bg-secondary)', border: '1px solid var(--border-primary)' }}>
-                  <h3 className="text-sm font-medium mb-3" style={{ color: 'var(--text-primary)' }}>Metadata</h3>
+                <div className="p-4 rounded-lg border" style={styles.infoCard}>
+                  <h3 className="text-sm font-medium mb-3" style={styles.primaryText}>Metadata</h3>
                   <div className="grid grid-cols-1 md:grid-cols-2 gap-4 text-xs">
                     <div>
-                      <span style={{ color: 'var(--text-muted)' }}>Created:</span>
-                      <div className="font-mono mt-1" style={{ color: 'var(--text-primary)' }}>
+                      <span style={styles.mutedText}>Created:</span>
+                      <div className="font-mono mt-1" style={styles.primaryText}>
                         {new Date(selectedEndpoint.createdAt).toLocaleString()}
                       </div>
                     </div>
                     {selectedEndpoint.updatedAt && (
                       <div>
-                        <span style={{ color: 'var(--text-muted)' }}>Last Updated:</span>
-                        <div className="font-mono mt-1" style={{ color: 'var(--text-primary)' }}>
+                        <span style={styles.mutedText}>Last Updated:</span>
+                        <div className="font-mono mt-1" style={styles.primaryText}>
                           {new Date(selectedEndpoint.updatedAt).toLocaleString()}
                         </div>
                       </div>
@@ -599,15 +622,15 @@ function LLMEndpointSettings() {
           <div className="h-full flex items-center justify-center">
             <div className="text-center max-w-md mx-auto p-8">
               <div className="mb-6">
-                <div className="w-16 h-16 mx-auto mb-4 rounded-2xl flex items-center justify-center" style={{ background: 'var(--bg-tertiary)' }}>
-                  <svg className="w-8 h-8" style={{ color: 'var(--text-muted)' }} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                <div className="w-16 h-16 mx-auto mb-4 rounded-2xl flex items-center justify-center" style={styles.iconBox}>
+                  <svg className="w-8 h-8" style={styles.mutedText} fill="none" stroke="currentColor" viewBox="0 0 24 24">
                     <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12l2 2 4-4M7.835 4.697a3.42 3.42 0 001.946-.806 3.42 3.42 0 014.438 0 3.42 3.42 0 001.946.806 3.42 3.42 0 013.138 3.138 3.42 3.42 0 00.806 1.946 3.42 3.42 0 010 4.438 3.42 3.42 0 00-.806 1.946 3.42 3.42 0 01-3.138 3.138 3.42 3.42 0 00-1.946.806 3.42 3.42 0 01-4.438 0 3.42 3.42 0 00-1.946-.806 3.42 3.42 0 01-3.138-3.138 3.42 3.42 0 00-.806-1.946 3.42 3.42 0 010-4.438 3.42 3.42 0 00.806-1.946 3.42 3.42 0 013.138-3.138z" />
                   </svg>
                 </div>
-                <h3 className="text-lg font-semibold mb-2" style={{ color: 'var(--text-primary)' }}>
+                <h3 className="text-lg font-semibold mb-2" style={styles.primaryText}>
                   LLM Provider Settings
                 </h3>
-                <p className="text-sm leading-relaxed" style={{ color: 'var(--text-muted)' }}>
+                <p className="text-sm leading-relaxed" style={styles.mutedText}>
                   Select a provider from the sidebar to view its configuration, or create a new one to get started with your AI workflows.
                 </p>
               </div>
@@ -616,7 +639,7 @@ function LLMEndpointSettings() {
                 <button
                   onClick={handleCreateNew}
                   className="flex items-center justify-center gap-2 px-4 py-2 text-sm rounded-lg transition-all duration-200"
-                  style={{ background: 'var(--accent-primary)', color: 'white', border: 'none' }}
+                  style={styles.primaryButton}
                 >
                   <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                     <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 6v6m0 0v6m0-6h6m-6 0H6" />
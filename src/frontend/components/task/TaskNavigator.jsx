@@ -1,40 +1,90 @@
 // src/frontend/components/task/TaskNavigator.jsx
-import React, { useState, useMemo, useEffect, useRef } from 'react';
+import React, { useState, useMemo, useEffect, useRef, useCallback } from 'react';
 import { useStore } from '../../store.jsx';
 
+const formatTimeAgo = (updatedAtMs, now) => {
+  if (!updatedAtMs) return 'Unknown';
+  const diffInHours = Math.floor((now - updatedAtMs) / (1000 * 60 * 60));
+  
+  if (diffInHours < 1) return 'Just now';
+  if (diffInHours < 24) return `${diffInHours}h ago`;
+  if (diffInHours < 48) return 'Yesterday';
+  return `${Math.floor(diffInHours / 24)} days ago`;
+};
+
+const compareByName = (a, b) => a.name.localeCompare(b.name);
+
+// Task 목록 한 줄 - 원시값 props만 받아서 바뀐 줄만 다시 렌더링
+const TaskItem = React.memo(({ id, name, isFavorite, versionCount, timeAgo, isActive }) => (
+  <div
+    className={`task-item group flex items-center justify-between ${isActive ? 'is-active' : ''}`}
+    data-task-id={id}
+  >
+    <div className="flex-1 min-w-0">
+      <div className="flex items-center gap-2 mb-1">
+        <span className="text-sm">📄</span>
+        <span
+          className="text-sm font-medium truncate"
+        >
+          {name}
+        </span>
+      </div>
+      <div className="text-muted text-xs">
+        {versionCount} versions • Modified {timeAgo}
+      </div>
+    </div>
+    <button 
+      type="button"
+      className={`favorite-btn opacity-0 group-hover:opacity-100 transition-opacity ${isFavorite ? 'is-fav' : ''}`}
+      aria-pressed={isFavorite}
+      title={isFavorite ? 'Remove from favorites' : 'Add to favorites'}
+      data-action="favorite"
+    >
+      <span>
+        {isFavorite ? '★' : '☆'}
+      </span>
+    </button>
+  </div>
+));
+
+// 탭 컨테이너 너비 -> 탭 텍스트 크기 구분 (구분이 바뀔 때만 다시 렌더링)
+const getWidthClass = (width) => {
+  if (width < 200) return 'xs';
+  if (width < 280) return 'sm';
+  return 'md';
+};
+
 const TaskNavigator = ({ tasks, currentTask, onSelectTask }) => {
   const { createTask, deleteTask, toggleFavorite } = useStore();
   const [activeTab, setActiveTab] = useState('all'); // all, recent, favorites
-  const [containerWidth, setContainerWidth] = useState(null);
+  const [widthClass, setWidthClass] = useState(null);
   const tabContainerRef = useRef(null);
 
-  // 컨테이너 너비 모니터링
+  // 컨테이너 너비 모니터링 - resize 이벤트마다 offsetWidth로 레이아웃을 강제로 읽지 않고
+  // 브라우저 레이아웃 결과를 ResizeObserver로 받음 (패널 크기 변경도 함께 감지)
   useEffect(() => {
-    const updateWidth = () => {
-      if (tabContainerRef.current) {
-        const width = tabContainerRef.current.offsetWidth;
-        setContainerWidth(width);
-        console.log('[TaskNavigator] Tab container width:', width);
-      }
-    };
+    const container = tabContainerRef.current;
+    if (!container) return;
 
-    // 초기 너비 설정
-    updateWidth();
+    const observer = new ResizeObserver((entries) => {
+      const entry = entries[0];
+      // offsetWidth와 같은 기준(테두리 포함 너비)으로 비교
+      const width = entry.borderBoxSize?.[0]?.inlineSize ?? entry.contentRect.width;
+      setWidthClass(getWidthClass(width));
+    });
+    observer.observe(container);
 
-    // 리사이즈 이벤트 리스너
-    window.addEventListener('resize', updateWidth);
-    
     return () => {
-      window.removeEventListener('resize', updateWidth);
+      observer.disconnect();
     };
   }, []);
 
   // 반응형 탭 텍스트 결정
   const getTabText = (tabType) => {
-    if (containerWidth === null) return tabType.charAt(0).toUpperCase() + tabType.slice(1);
+    if (widthClass === null) return tabType.charAt(0).toUpperCase() + tabType.slice(1);
     
     // 매우 작은 화면 (200px 미만)에서는 아이콘/짧은 텍스트 사용
-    if (containerWidth < 200) {
+    if (widthClass === 'xs') {
       switch(tabType) {
         case 'all': return 'All';
         case 'recent': return 'New';
@@ -44,7 +94,7 @@ const TaskNavigator = ({ tasks, currentTask, onSelectTask }) => {
     }
     
     // 작은 화면 (280px 미만)에서는 줄인 텍스트 사용
-    if (containerWidth < 280) {
+    if (widthClass === 'sm') {
       switch(tabType) {
         case 'all': return 'All';
         case 'recent': return 'Recent';
@@ -90,31 +140,46 @@ const TaskNavigator = ({ tasks, currentTask, onSelectTask }) => {
     }
   };
 
-  const formatTimeAgo = (updatedAt) => {
-    if (!updatedAt) return 'Unknown';
-    const now = new Date();
-    const updated = new Date(updatedAt);
-    const diffInHours = Math.floor((now - updated) / (1000 * 60 * 60));
-    
-    if (diffInHours < 1) return 'Just now';
-    if (diffInHours < 24) return `${diffInHours}h ago`;
-    if (diffInHours < 48) return 'Yesterday';
-    return `${Math.floor(diffInHours / 24)} days ago`;
-  };
+  // Task 목록 클릭 처리 - 항목마다 핸들러를 만들지 않고 목록에서 한 번에 처리
+  const handleTaskListClick = useCallback((e) => {
+    const item = e.target.closest('[data-task-id]');
+    if (!item) return;
+    const taskId = item.dataset.taskId;
+    if (e.target.closest('[data-action="favorite"]')) {
+      toggleFavorite(taskId); // 즐겨찾기 버튼은 Task 선택 없이 토글만
+    } else {
+      onSelectTask(taskId);
+    }
+  }, [toggleFavorite, onSelectTask]);
 
-  const filteredTasks = useMemo(() => {
-    let taskArray = Object.values(tasks);
+  // 목록 표시에 필요한 값들을 tasks가 바뀔 때 한 번만 계산 (탭 전환/재렌더링 시 재사용)
+  const taskRows = useMemo(() => {
+    const now = Date.now();
+    return Object.values(tasks).map(task => {
+      const updatedAt = task.updatedAt || task.updated_at;
+      const updatedAtMs = updatedAt ? new Date(updatedAt).getTime() : 0;
+      return {
+        id: task.id,
+        name: task.name,
+        isFavorite: !!task.isFavorite,
+        versionCount: task.versions ? Object.keys(task.versions).length : 0,
+        updatedAtMs,
+        timeAgo: formatTimeAgo(updatedAtMs, now)
+      };
+    });
+  }, [tasks]);
 
+  const filteredTasks = useMemo(() => {
     switch (activeTab) {
       case 'recent':
-        return taskArray.sort((a, b) => new Date(b.updatedAt) - new Date(a.updatedAt));
+        return [...taskRows].sort((a, b) => b.updatedAtMs - a.updatedAtMs);
       case 'favorites':
-        return taskArray.filter(task => task.isFavorite).sort((a, b) => a.name.localeCompare(b.name));
+        return taskRows.filter(task => task.isFavorite).sort(compareByName);
       case 'all':
       default:
-        return taskArray.sort((a, b) => a.name.localeCompare(b.name));
+        return [...taskRows].sort(compareByName);
     }
-  }, [tasks, activeTab]);
+  }, [taskRows, activeTab]);
 
   return (
     <div className="h-full flex flex-col" style={{ background: 'var(--bg-secondary)' }}>
@@ -152,47 +217,18 @@ const TaskNavigator = ({ tasks, currentTask, onSelectTask }) => {
 
       {/* Task List */}
       <div className="flex-1 overflow-y-auto p-5">
-        <div className="space-y-1">
-          {filteredTasks.map(task => {
-            const isActive = currentTask === task.id;
-            const versionCount = task.versions ? Object.keys(task.versions).length : 0;
-
-            return (
-              <div
-                key={task.id}
-                className={`task-item group flex items-center justify-between ${isActive ? 'is-active' : ''}`}
-                onClick={() => onSelectTask(task.id)}
-              >
-                <div className="flex-1 min-w-0">
-                  <div className="flex items-center gap-2 mb-1">
-                    <span className="text-sm">📄</span>
-                    <span
-                      className="text-sm font-medium truncate"
-                    >
-                      {task.name}
-                    </span>
-                  </div>
-                  <div className="text-xs" style={{ color: 'var(--text-muted)' }}>
-                    {versionCount} versions • Modified {formatTimeAgo(task.updatedAt)}
-                  </div>
-                </div>
-                <button 
-                  type="button"
-                  className={`favorite-btn opacity-0 group-hover:opacity-100 transition-opacity ${task.isFavorite ? 'is-fav' : ''}`}
-                  aria-pressed={task.isFavorite}
-                  title={task.isFavorite ? 'Remove from favorites' : 'Add to favorites'}
-                  onClick={(e) => {
-                    e.stopPropagation(); // Prevent task selection
-                    toggleFavorite(task.id);
-                  }}
-                >
-                  <span>
-                    {task.isFavorite ? '★' : '☆'}
-                  </span>
-                </button>
-              </div>
-            );
-          })}
+        <div className="space-y-1" onClick={handleTaskListClick}>
+          {filteredTasks.map(task => (
+            <TaskItem
+              key={task.id}
+              id={task.id}
+              name={task.name}
+              isFavorite={task.isFavorite}
+              versionCount={task.versionCount}
+              timeAgo={task.timeAgo}
+              isActive={currentTask === task.id}
+            />
+          ))}
         </div>
 
         {/* Empty State */}
@@ -1,9 +1,96 @@
-import { createContext, useContext, useState, useCallback, useRef } from 'react';
-import { flushSync } from 'react-dom';
+import { createContext, useContext, useState, useCallback, useRef, useMemo, startTransition } from 'react';
 import { apiUrl, fetchFromAPI } from './utils/api';
 
 const PromptContext = createContext();
 
+// 버전이 없는 Task에서도 같은 참조를 돌려주기 위한 빈 배열
+const EMPTY_VERSIONS = [];
+
+// 템플릿 변수 패턴 ({{name}}) - 호출마다 정규식 객체를 새로 만들지 않도록 한 번만 생성
+// 영문자, 숫자, 언더스코어, 하이픈만 허용
+const TEMPLATE_VARIABLE_PATTERN = /\{\{([a-zA-Z_][a-zA-Z0-9_-]*)\}\}/g;
+
+// 버전 배열 -> (id -> 버전) 맵 캐시. 버전 배열은 바뀔 때 새 배열로 교체되므로
+// 배열마다 한 번만 맵을 만들고 이후 조회는 선형 탐색 없이 처리
+const versionIndexCache = new WeakMap();
+const getVersionIndex = (versions) => {
+  let index = versionIndexCache.get(versions);
+  if (!index) {
+    index = new Map(versions.map(version => [version.id, version]));
+    versionIndexCache.set(versions, index);
+  }
+  return index;
+};
+const findVersion = (versions, versionId) => (versions ? getVersionIndex(versions).get(versionId) : undefined);
+
+// 서버에서 다시 받은 버전 목록 중 내용이 그대로인 버전은 기존 객체를 재사용
+// (버전 id 맵, memo된 목록 항목이 매번 새 객체로 교체되어 다시 만들어지지 않도록 함)
+// 결과는 id로 비교 (로컬에서 막 추가한 결과처럼 id가 없으면 timestamp로 비교)
+const resultsUnchanged = (prevResults = [], nextResults = []) => (
+  prevResults.length === nextResults.length &&
+  prevResults.every((result, i) => (
+    result.id === nextResults[i].id && result.timestamp === nextResults[i].timestamp
+  ))
+);
+// updated_at이 같아도 편집 필드가 다르면 새 객체를 사용 (같은 시각에 저장된 연속 수정 대비)
+const versionUnchanged = (prev, next) => (
+  prev.updated_at === next.updated_at &&
+  prev.content === next.content &&
+  prev.system_prompt === next.system_prompt &&
+  prev.description === next.description &&
+  prev.name === next.name &&
+  resultsUnchanged(prev.results, next.results)
+);
+const reuseUnchangedVersions = (prevVersions, nextVersions) => {
+  if (!prevVersions || prevVersions.length === 0) return nextVersions;
+  const prevIndex = getVersionIndex(prevVersions);
+  let allReused = prevVersions.length === nextVersions.length;
+  const merged = nextVersions.map((version, i) => {
+    const prev = prevIndex.get(version.id);
+    if (prev && versionUnchanged(prev, version)) {
+      if (prevVersions[i] !== prev) allReused = false;
+      return prev;
+    }
+    allReused = false;
+    return version;
+  });
+  return allReused ? prevVersions : merged;
+};
+
+// 대기 중인 변수 저장 요청에 새 요청을 병합
+// 전체 교체({ variables })는 그대로 대체하고, 값 변경분({ changes })은 앞선 요청 위에 누적
+const mergeVariableSaves = (queued, op) => {
+  if (!queued || op.variables) return op;
+  if (queued.variables) return { variables: { ...queued.variables, ...op.changes } };
+  return { changes: { ...queued.changes, ...op.changes } };
+};
+
+// /api/llm/call/stream 응답(NDJSON) 읽기 - delta 줄은 onDelta로 넘기고 마지막 result 줄을 반환
+const readLLMStream = async (response, onDelta) => {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = null;
+  const handleLine = (line) => {
+    if (!line.trim()) return;
+    const message = JSON.parse(line);
+    if (message.error) throw new Error(message.error);
+    if (message.delta) onDelta(message.delta);
+    if (message.result) result = message.result;
+  };
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer + decoder.decode());
+  if (!result) throw new Error('LLM API call failed');
+  return result;
+};
+
 export const useStore = () => useContext(PromptContext);
 
 export const PromptProvider = ({ children }) => {
@@ -14,8 +101,9 @@ export const PromptProvider = ({ children }) => {
   };
   
   const [tasks, setTasks] = useState({});
+  const tasksRef = useRef(tasks); // 콜백 의존성에 tasks를 넣지 않고 최신 값을 읽기 위한 참조
+  tasksRef.current = tasks;
   const [currentTask, setCurrentTask] = useState(getInitialCurrentTask);
-  const [versions, setVersions] = useState([]);
   const [currentVersion, setCurrentVersion] = useState(null);
   const [currentSystemPrompt, setCurrentSystemPrompt] = useState(''); // 현재 선택된 버전의 system prompt 내용
   const [isEditMode, setIsEditMode] = useState(true); // 편집 모드 상태 추가
@@ -26,6 +114,8 @@ export const PromptProvider = ({ children }) => {
   
   // LLM Endpoints 상태 추가
   const [llmEndpoints, setLlmEndpoints] = useState([]); // 저장된 모든 엔드포인트 목록
+  const llmEndpointsRef = useRef(llmEndpoints); // 콜백 의존성 없이 최신 엔드포인트 목록을 읽기 위한 참조
+  llmEndpointsRef.current = llmEndpoints;
   const [activeLlmEndpointId, setActiveLlmEndpointId] = useState(null); // 현재 사용 중인 엔드포인트 ID
   const [defaultLlmEndpointId, setDefaultLlmEndpointId] = useState(null); // 기본값 엔드포인트 ID
   
@@ -187,6 +277,12 @@ export const PromptProvider = ({ children }) => {
   }, []);
   
   const updateLlmEndpoint = useCallback(async (id, updates) => {
+    // 저장된 값과 모두 같으면 (예: 이름을 그대로 두고 저장) 서버 요청 없이 기존 엔드포인트 반환
+    const savedEndpoint = llmEndpointsRef.current.find(ep => ep.id === id);
+    if (savedEndpoint && Object.keys(updates).every(key => savedEndpoint[key] === updates[key])) {
+      return savedEndpoint;
+    }
+
     try {
       console.log('✏️ LLM Endpoint 업데이트 시작:', { id, updates });
       
@@ -320,18 +416,19 @@ export const PromptProvider = ({ children }) => {
       console.log('🔧 [DEBUG] store.jsx: loadTasks API 응답:', data);
       
       if (data.tasks) {
-        const tasksMap = data.tasks.reduce((acc, task) => {
+        // 한 번의 루프로 맵을 만들고 상태는 한 번만 갱신 (Task별 로그 없음)
+        const tasksMap = {};
+        for (const task of data.tasks) {
           // variables 필드가 없으면 빈 객체로 초기화
           if (!task.variables) {
             task.variables = {};
-            console.log(`🔧 [DEBUG] store.jsx: Task ${task.id}에 variables 필드 추가`);
           }
-          
-          console.log(`🔧 [DEBUG] store.jsx: Task ${task.id} 로드, variables:`, task.variables);
-          acc[task.id] = task;
-          return acc;
-        }, {});
-        setTasks(tasksMap);
+          tasksMap[task.id] = task;
+        }
+        // 목록 전체를 다시 그리는 갱신이므로 입력/클릭을 막지 않도록 전환 업데이트로 처리
+        startTransition(() => {
+          setTasks(tasksMap);
+        });
         console.log('🔧 [DEBUG] store.jsx: loadTasks 완료, 총', data.tasks.length, '개 Task 로드');
       }
     } catch (error) {
@@ -384,7 +481,6 @@ export const PromptProvider = ({ children }) => {
       if (currentTask === taskId) {
         setCurrentTask(null);
         setCurrentVersion(null);
-        setVersions([]);
         setTemplateVariables([]);
       }
     } catch (error) {
@@ -517,30 +613,34 @@ export const PromptProvider = ({ children }) => {
       const data = await fetchFromAPI(apiUrl(`/api/tasks/${taskId}/versions`));
       const serverVersions = data.versions || [];
 
-      setTasks(prevTasks => ({
-        ...prevTasks,
-        [taskId]: {
-          ...prevTasks[taskId],
-          versions: serverVersions
-        }
-      }));
+      // 응답 반영(버전 목록/에디터 재렌더링)은 전환 업데이트로 처리해
+      // 로딩 중에도 타이핑, 스크롤, Task 전환이 막히지 않도록 한다
+      startTransition(() => {
+        setTasks(prevTasks => ({
+          ...prevTasks,
+          [taskId]: {
+            ...prevTasks[taskId],
+            versions: reuseUnchangedVersions(prevTasks[taskId]?.versions, serverVersions)
+          }
+        }));
 
-      setVersions(serverVersions); // Keep this for other components that might use it directly
+        if (serverVersions.length > 0) {
+          setCurrentVersion(versionToSelect);
+          setCurrentSystemPrompt('You are a helpful assistant.');
+          setIsEditMode(false);
+        } else {
+          setCurrentVersion(null);
+          setCurrentSystemPrompt('You are a helpful assistant.');
+          setIsEditMode(true);
+          setTemplateVariables([]);
+        }
+      });
 
       if (serverVersions.length > 0) {
-        setCurrentVersion(versionToSelect);
-        setCurrentSystemPrompt('You are a helpful assistant.');
-        setIsEditMode(false);
         loadTemplateVariables(taskId);
-      } else {
-        setCurrentVersion(null);
-        setCurrentSystemPrompt('You are a helpful assistant.');
-        setIsEditMode(true);
-        setTemplateVariables([]);
       }
     } catch (error) {
       console.error('Error loading versions:', error);
-      setVersions([]);
       setCurrentVersion(null);
       setIsEditMode(true);
     } finally {
@@ -569,27 +669,52 @@ export const PromptProvider = ({ children }) => {
         throw new Error('Failed to create version on the server');
       }
 
-      // After creating, reload the versions to update the UI
-      loadVersions(taskId);
+      const { version } = await response.json();
+      if (!version) {
+        loadVersions(taskId);
+        return;
+      }
+
+      // 생성된 버전만 목록 맨 앞(최신순)에 추가 - 전체 버전 목록을 다시 불러오지 않음
+      setTasks(prevTasks => {
+        const task = prevTasks[taskId];
+        if (!task) return prevTasks;
+        return {
+          ...prevTasks,
+          [taskId]: { ...task, versions: [version, ...(task.versions || [])] }
+        };
+      });
 
     } catch (error) {
       console.error('Error creating version:', error);
     }
   }, [loadVersions]);
   
+  // 현재 Task의 버전 목록 (tasks가 유일한 원본이며 별도 상태로 복제하지 않음)
+  const versions = tasks[currentTask]?.versions || EMPTY_VERSIONS;
+  
+  // 버전 id -> 버전 조회 맵 (버전 목록이 바뀔 때만 다시 생성)
+  const versionsById = useMemo(() => getVersionIndex(versions), [versions]);
+  
   // 버전 선택 및 편집 모드 설정
   const selectVersion = useCallback((versionId, editMode = false) => {
     setCurrentVersion(versionId);
     setIsEditMode(editMode);
     
     // 선택된 버전의 system prompt 설정
-    const version = versions.find(v => v.id === versionId);
+    const version = versionsById.get(versionId);
     if (version) {
       setCurrentSystemPrompt(version.system_prompt || 'You are a helpful assistant.');
     }
-  }, [versions]);
+  }, [versionsById]);
   
   const updateVersion = useCallback(async (taskId, versionId, updates) => {
+    // 마지막으로 저장된 버전과 내용이 같으면 서버 요청을 생략
+    const savedVersion = findVersion(tasksRef.current[taskId]?.versions, versionId);
+    if (savedVersion && Object.keys(updates).every(key => savedVersion[key] === updates[key])) {
+      return;
+    }
+
     try {
       const response = await fetch(apiUrl(`/api/tasks/${taskId}/versions/${versionId}`), {
         method: 'PUT',
@@ -601,15 +726,25 @@ export const PromptProvider = ({ children }) => {
         throw new Error('Failed to update version on the server');
       }
 
-      // After a successful update, refetch the versions to ensure UI is in sync
-      // Pass the current versionId to stay on the same version view
-      loadVersions(taskId, { versionToSelect: versionId });
+      // 저장 후 버전 목록 전체를 다시 불러오지 않고 수정된 버전만 로컬에서 갱신
+      // (다른 버전 객체는 그대로 유지되어 목록/타임라인이 다시 그려지지 않음)
+      setTasks(prevTasks => {
+        const task = prevTasks[taskId];
+        if (!task || !task.versions) return prevTasks;
+        return {
+          ...prevTasks,
+          [taskId]: {
+            ...task,
+            versions: task.versions.map(v => (v.id === versionId ? { ...v, ...updates } : v))
+          }
+        };
+      });
 
     } catch (error) {
       console.error('Error updating version:', error);
       // Optionally, show an error message to the user
     }
-  }, [loadVersions]);
+  }, []);
   
   // 버전 상세 정보 확인
   const getVersionDetail = useCallback(async (taskId, versionId) => {
@@ -617,7 +752,7 @@ export const PromptProvider = ({ children }) => {
       console.log(`버전 상세 정보 요청: ${taskId}/${versionId}`);
       
       // 먼저 로드된 버전 목록에서 찾기
-      const localVersion = versions.find(v => v.id === versionId);
+      const localVersion = versionsById.get(versionId);
       if (localVersion) {
         console.log('로컬 버전 정보로 처리함:', localVersion);
         return localVersion;
@@ -630,7 +765,7 @@ export const PromptProvider = ({ children }) => {
       console.error(`버전 상세 정보 가져오기 오류:`, error);
       return null;
     }
-  }, [versions]);
+  }, [versionsById]);
   
   const deleteVersion = useCallback(async (taskId, versionId) => {
     try {
@@ -642,14 +777,26 @@ export const PromptProvider = ({ children }) => {
         throw new Error('Failed to delete version on the server');
       }
 
-      // Refetch versions for the task to update the UI
-      loadVersions(taskId);
+      // 목록 전체를 다시 불러와 모든 항목을 새로 그리지 않고,
+      // 삭제된 버전만 한 번의 상태 갱신으로 제거 (나머지 버전 객체는 그대로 유지)
+      setTasks(prevTasks => {
+        const task = prevTasks[taskId];
+        if (!task || !task.versions) return prevTasks;
+        return {
+          ...prevTasks,
+          [taskId]: {
+            ...task,
+            versions: task.versions.filter(v => v.id !== versionId)
+          }
+        };
+      });
+      setCurrentVersion(prev => (prev === versionId ? null : prev));
 
     } catch (error) {
       console.error('Error deleting version:', error);
       throw error;
     }
-  }, [loadVersions]);
+  }, []);
 
   const deleteHistoryItem = useCallback(async (taskId, versionId, resultTimestamp) => {
     try {
@@ -658,7 +805,7 @@ export const PromptProvider = ({ children }) => {
         const newTasks = { ...prevTasks };
         const task = newTasks[taskId];
         if (task) {
-          const version = task.versions.find(v => v.id === versionId);
+          const version = findVersion(task.versions, versionId);
           if (version) {
             version.results = version.results.filter(r => r.timestamp !== resultTimestamp);
           }
@@ -691,10 +838,12 @@ export const PromptProvider = ({ children }) => {
     selectVersion('new-version', true);
   }, [selectVersion]);
   
-  const updateVariables = useCallback(async (taskId, variables) => {
+  // Task별 변수 저장 대기열 - 요청이 진행 중이면 최신 값만 남겨 두었다가 끝난 뒤 한 번만 전송
+  // (연속 저장이 겹쳐도 요청은 최대 2개이고, 늦게 도착한 이전 응답이 최신 값을 덮어쓰지 않음)
+  const variableSaveQueueRef = useRef(new Map());
+
+  const putVariables = useCallback(async (taskId, variables) => {
     try {
-      console.log(`🔧 [DEBUG] store.js 변수 업데이트 시작: taskId=${taskId}`, variables);
-      
       const response = await fetch(apiUrl(`/api/tasks/${taskId}/variables`), {
         method: 'PUT',
         headers: { 'Content-Type': 'application/json' },
@@ -712,7 +861,6 @@ export const PromptProvider = ({ children }) => {
         }));
         
         setTemplateVariables(variables);
-        console.log('✅ store.jsx: 변수 업데이트 및 Task 상태 동기화 완료:', variables);
       } else {
         console.error('❌ store.jsx: 변수 업데이트 실패:', response.status);
       }
@@ -720,32 +868,100 @@ export const PromptProvider = ({ children }) => {
       console.error('❌ store.jsx: 변수 업데이트 오류:', error);
     }
   }, []);
+
+  // 값 변경분만 전송 - 서버가 기존 변수에 병합해서 저장
+  const patchVariables = useCallback(async (taskId, changes) => {
+    try {
+      const response = await fetch(apiUrl(`/api/tasks/${taskId}/variables`), {
+        method: 'PATCH',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ variables: changes })
+      });
+      
+      if (response.ok) {
+        const { variables } = await response.json();
+        setTasks(prevTasks => ({
+          ...prevTasks,
+          [taskId]: {
+            ...prevTasks[taskId],
+            variables
+          }
+        }));
+        
+        setTemplateVariables(variables);
+      } else {
+        console.error('❌ store.jsx: 변수 업데이트 실패:', response.status);
+      }
+    } catch (error) {
+      console.error('❌ store.jsx: 변수 업데이트 오류:', error);
+    }
+  }, []);
+
+  const enqueueVariableSave = useCallback((taskId, op) => {
+    const queue = variableSaveQueueRef.current;
+    const pending = queue.get(taskId);
+    if (pending) {
+      pending.queued = mergeVariableSaves(pending.queued, op);
+      return pending.done;
+    }
+
+    const entry = { queued: op, done: null };
+    queue.set(taskId, entry);
+    entry.done = (async () => {
+      try {
+        while (entry.queued) {
+          const next = entry.queued;
+          entry.queued = null;
+          await (next.variables
+            ? putVariables(taskId, next.variables)
+            : patchVariables(taskId, next.changes));
+        }
+      } finally {
+        queue.delete(taskId);
+      }
+    })();
+    return entry.done;
+  }, [putVariables, patchVariables]);
+
+  // 변수 추가/삭제 - 전체 변수 객체로 교체
+  const updateVariables = useCallback(
+    (taskId, variables) => enqueueVariableSave(taskId, { variables }),
+    [enqueueVariableSave]
+  );
+
+  // 변수 값 입력 - 바뀐 이름/값만 전송 (키 입력마다 전체 변수 객체를 보내지 않음)
+  const updateVariableValues = useCallback(
+    (taskId, changes) => enqueueVariableSave(taskId, { changes }),
+    [enqueueVariableSave]
+  );
   
   const extractVariables = useCallback((content) => {
-    // 더 정확한 변수 추출을 위해 영문자, 숫자, 언더스코어, 하이픈만 허용
-    const matches = content.match(/\{\{([a-zA-Z_][a-zA-Z0-9_-]*)\}\}/g) || [];
+    const matches = content.match(TEMPLATE_VARIABLE_PATTERN) || [];
     const variables = matches.map(match => match.slice(2, -2).trim());
     return variables;
   }, []);
   
   const renderPrompt = useCallback((template, variables) => {
-    return template.replace(/\{\{([a-zA-Z_][a-zA-Z0-9_-]*)\}\}/g, (match, key) => {
+    // 변수 문법이 없으면 정규식 스캔 없이 그대로 반환
+    if (!template || !template.includes('{{')) return template;
+    return template.replace(TEMPLATE_VARIABLE_PATTERN, (match, key) => {
       const trimmedKey = key.trim();
       return variables[trimmedKey] !== undefined ? variables[trimmedKey] : match;
     });
   }, []);
   
+  // 엔드포인트 id -> 엔드포인트 맵 (목록이 바뀔 때만 다시 생성, 조회는 선형 탐색 없이 처리)
+  const llmEndpointsById = useMemo(
+    () => new Map(llmEndpoints.map(endpoint => [endpoint.id, endpoint])),
+    [llmEndpoints]
+  );
+  const activeLlmEndpoint = llmEndpointsById.get(activeLlmEndpointId) || null;
+  
   // LLM 통합 - 활성화된 엔드포인트 정보 사용
-  const callLLM = useCallback(async (taskId, versionId, inputData, systemPromptContent) => {
+  // onDelta를 넘기면 응답을 스트리밍으로 받아 생성되는 텍스트 조각마다 호출
+  const callLLM = useCallback(async (taskId, versionId, inputData, systemPromptContent, onDelta) => {
     try {
-      console.log('🔧 [DEBUG] callLLM 함수 시작:');
-      console.log('  - activeLlmEndpointId:', activeLlmEndpointId);
-      console.log('  - llmEndpoints 배열:', llmEndpoints);
-      console.log('  - llmEndpoints 길이:', llmEndpoints.length);
-      
-      // 활성화된 엔드포인트 찾기
-      const activeEndpoint = llmEndpoints.find(ep => ep.id === activeLlmEndpointId);
-      console.log('🔧 [DEBUG] 찾은 activeEndpoint:', activeEndpoint);
+      const activeEndpoint = activeLlmEndpoint;
       
       const requestBody = {
         taskId,
@@ -760,9 +976,7 @@ export const PromptProvider = ({ children }) => {
         } : null
       };
       
-      console.log('🔧 [DEBUG] 백엔드로 전송할 요청 데이터:', requestBody);
-      
-      const response = await fetch(apiUrl('/api/llm/call'), {
+      const response = await fetch(apiUrl(onDelta ? '/api/llm/call/stream' : '/api/llm/call'), {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify(requestBody)
@@ -772,11 +986,11 @@ export const PromptProvider = ({ children }) => {
         throw new Error('LLM API call failed');
       }
       
-      const data = await response.json();
+      const output = onDelta ? await readLLMStream(response, onDelta) : (await response.json()).result;
       
       const newResult = {
         inputData,
-        output: data.result,
+        output,
         timestamp: new Date().toISOString(),
         endpoint: activeEndpoint
       };
@@ -786,7 +1000,7 @@ export const PromptProvider = ({ children }) => {
         const newTasks = { ...prevTasks };
         const task = newTasks[taskId];
         if (task) {
-          const version = task.versions.find(v => v.id === versionId);
+          const version = findVersion(task.versions, versionId);
           if (version) {
             if (!Array.isArray(version.results)) {
               version.results = [];
@@ -797,22 +1011,19 @@ export const PromptProvider = ({ children }) => {
         return newTasks;
       });
       
-      // Also update the separate versions state for any components that might still rely on it
-      setVersions(prev => prev.map(v => v.id === versionId ? { ...v, results: [newResult, ...(v.results || [])] } : v));
-      
-      return data.result;
+      return output;
     } catch (error) {
       console.error('Error calling LLM:', error);
       throw error;
     }
-  }, [llmEndpoints, activeLlmEndpointId]);
+  }, [activeLlmEndpoint]);
   
   const getVersionResults = useCallback((taskId, versionId) => {
     if (!taskId || !versionId || !tasks[taskId]) {
       return [];
     }
     const task = tasks[taskId];
-    const version = task.versions?.find(v => v.id === versionId);
+    const version = findVersion(task.versions, versionId);
     return version?.results || [];
   }, [tasks]);
   
@@ -843,6 +1054,7 @@ export const PromptProvider = ({ children }) => {
       tasks,
       currentTask,
       versions,
+      versionsById,
       currentVersion,
       currentSystemPrompt, // 현재 선택된 버전의 system prompt 상태 추가
       isEditMode,
@@ -853,6 +1065,8 @@ export const PromptProvider = ({ children }) => {
       
       // LLM Endpoints 상태 추가
       llmEndpoints,
+      llmEndpointsById,
+      activeLlmEndpoint,
       activeLlmEndpointId,
       defaultLlmEndpointId,
       
@@ -884,6 +1098,7 @@ export const PromptProvider = ({ children }) => {
       getVersionDetail,
       loadTemplateVariables,
       updateVariables,
+      updateVariableValues,
       extractVariables,
       renderPrompt,
       callLLM,